@@ -104,7 +104,12 @@ _FALLBACK_RESULT = SHIPMENT_FALLBACK_RESULT
 # System prompt is now sourced from shipping_shared — edit it there to affect both flows
 _RISK_SYSTEM_PROMPT = SHIPMENT_RISK_SYSTEM_PROMPT
 
-_risk_prompt: ChatPromptTemplate | None = None
+_RISK_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", _RISK_SYSTEM_PROMPT),
+        ("user", "{context_json}"),
+    ]
+)
 
 
 def _get_risk_chain() -> Any | None:
@@ -112,20 +117,10 @@ def _get_risk_chain() -> Any | None:
 
     Returns None when no LLM is configured (callers use heuristic fallback).
     """
-    global _risk_prompt
-
     llm = get_chat_model()
     if llm is None:
         return None
-
-    if _risk_prompt is None:
-        _risk_prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", _RISK_SYSTEM_PROMPT),
-                ("user", "{context_json}"),
-            ]
-        )
-    return _risk_prompt | llm
+    return _RISK_PROMPT | llm
 
 
 # ---------------------------------------------------------------------------
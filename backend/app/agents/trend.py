@@ -345,95 +345,88 @@ def _build_trend_items_node(state: TrendAgentState) -> TrendAgentState:
 # LLM node — LangChain prompt → structured insight list
 # ---------------------------------------------------------------------------
 
-_INSIGHT_PROMPT: ChatPromptTemplate | None = None
-
-
-def _get_insight_prompt() -> ChatPromptTemplate:
-    global _INSIGHT_PROMPT
-    if _INSIGHT_PROMPT is None:
-        _INSIGHT_PROMPT = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    (
-                        "You are a Supply Chain Trend Intelligence Agent. "
-                        "You receive a list of real-time and recent news/trend articles "
-                        "(fetched from NewsAPI /everything, /top-headlines, and broad "
-                        "headline scanning) plus the OEM's supplier and material context. "
-                        "Your task is to generate structured trend insights "
-                        "covering three scopes: material, supplier, and global.\n\n"
-                        "RECENCY RULES:\n"
-                        "- Each article includes a 'published_at' timestamp. Treat articles "
-                        "published within the last 24 hours as breaking news — prioritise "
-                        "them and assign higher confidence and severity where warranted.\n"
-                        "- Articles from the last 3 days are recent; weight them more than "
-                        "older background articles.\n"
-                        "- Do NOT ignore a recent article simply because it is a single data "
-                        "point — breaking events (e.g. war, factory shutdown, port closure) "
-                        "can have immediate critical impact even without corroboration.\n\n"
-                        "GEOGRAPHIC MAPPING RULES:\n"
-                        "- The 'Suppliers context' section lists each supplier with their "
-                        "name, country, region, and commodities. Cross-reference every "
-                        "news article against these supplier locations.\n"
-                        "- If an article mentions a country or region where a supplier "
-                        "operates, create an insight with scope='supplier' and "
-                        "entity_name set to that supplier's name.\n"
-                        "- If an article discusses a commodity that a supplier provides, "
-                        "it affects that supplier — even if the event is in a different "
-                        "region (commodity supply chains are global).\n"
-                        "- For events like war, natural disasters, sanctions, or port "
-                        "closures: also consider indirect impact on trade routes and "
-                        "neighbouring regions that connect to the supplier.\n"
-                        "- Example: 'War in Ukraine' → check if any supplier is in "
-                        "Ukraine, Russia, or neighbouring countries. If yes, create a "
-                        "'critical' supplier insight. Also create a 'global' insight "
-                        "for broader trade-route impact.\n\n"
-                        "SEVERITY RULES FOR CONFLICT AND WAR:\n"
-                        "- Active war or armed conflict in a supplier's region → severity "
-                        "'critical', risk_opportunity 'risk'.\n"
-                        "- Geopolitical tension, sanctions, or military exercises near key "
-                        "trade routes or supplier regions → severity 'high'.\n\n"
-                        "For EACH insight return:\n"
-                        "  scope          — 'material' | 'supplier' | 'global'\n"
-                        "  entity_name    — material name, supplier name, or 'Global'\n"
-                        "  risk_opportunity — 'risk' | 'opportunity'\n"
-                        "  title          — concise headline (max 15 words)\n"
-                        "  description    — 2-4 sentences of context, citing the article date "
-                        "if it is recent (e.g. 'As of Feb 28 2026, ...'). "
-                        "Mention which supplier(s) are affected and why.\n"
-                        "  predicted_impact — single plain string (e.g. '10% cost increase by Q3')\n"
-                        "  time_horizon   — 'short-term' | 'medium-term' | 'long-term'\n"
-                        "  severity       — 'low' | 'medium' | 'high' | 'critical'\n"
-                        "  recommended_actions — array of 3-5 plain action strings\n"
-                        "  source_articles — array of article title strings used as evidence\n"
-                        "  confidence     — float 0-1 (higher when article is recent and from "
-                        "a credible source)\n\n"
-                        "Return ONLY valid JSON — an array of insight objects. "
-                        "No markdown, no prose outside the JSON array."
-                    ),
-                ),
-                (
-                    "user",
-                    (
-                        "OEM: {oem_name}\n\n"
-                        "=== Suppliers context (with locations and commodities) ===\n"
-                        "{suppliers_json}\n\n"
-                        "=== Materials context ===\n"
-                        "{materials_json}\n\n"
-                        "=== Trend articles (most recent first, max 40) ===\n"
-                        "{trend_items_json}\n\n"
-                        "Today's date: {today_date}\n\n"
-                        "Generate 10-15 trend insights covering all three scopes "
-                        "(material, supplier, global). For each supplier-scope insight, "
-                        "set entity_name to the EXACT supplier name from the list above. "
-                        "Prioritise the most recent and highest-impact events, especially "
-                        "those that directly affect a supplier's country or commodity. "
-                        "Return a JSON array."
-                    ),
-                ),
-            ]
-        )
-    return _INSIGHT_PROMPT
+_INSIGHT_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            (
+                "You are a Supply Chain Trend Intelligence Agent. "
+                "You receive a list of real-time and recent news/trend articles "
+                "(fetched from NewsAPI /everything, /top-headlines, and broad "
+                "headline scanning) plus the OEM's supplier and material context. "
+                "Your task is to generate structured trend insights "
+                "covering three scopes: material, supplier, and global.\n\n"
+                "RECENCY RULES:\n"
+                "- Each article includes a 'published_at' timestamp. Treat articles "
+                "published within the last 24 hours as breaking news — prioritise "
+                "them and assign higher confidence and severity where warranted.\n"
+                "- Articles from the last 3 days are recent; weight them more than "
+                "older background articles.\n"
+                "- Do NOT ignore a recent article simply because it is a single data "
+                "point — breaking events (e.g. war, factory shutdown, port closure) "
+                "can have immediate critical impact even without corroboration.\n\n"
+                "GEOGRAPHIC MAPPING RULES:\n"
+                "- The 'Suppliers context' section lists each supplier with their "
+                "name, country, region, and commodities. Cross-reference every "
+                "news article against these supplier locations.\n"
+                "- If an article mentions a country or region where a supplier "
+                "operates, create an insight with scope='supplier' and "
+                "entity_name set to that supplier's name.\n"
+                "- If an article discusses a commodity that a supplier provides, "
+                "it affects that supplier — even if the event is in a different "
+                "region (commodity supply chains are global).\n"
+                "- For events like war, natural disasters, sanctions, or port "
+                "closures: also consider indirect impact on trade routes and "
+                "neighbouring regions that connect to the supplier.\n"
+                "- Example: 'War in Ukraine' → check if any supplier is in "
+                "Ukraine, Russia, or neighbouring countries. If yes, create a "
+                "'critical' supplier insight. Also create a 'global' insight "
+                "for broader trade-route impact.\n\n"
+                "SEVERITY RULES FOR CONFLICT AND WAR:\n"
+                "- Active war or armed conflict in a supplier's region → severity "
+                "'critical', risk_opportunity 'risk'.\n"
+                "- Geopolitical tension, sanctions, or military exercises near key "
+                "trade routes or supplier regions → severity 'high'.\n\n"
+                "For EACH insight return:\n"
+                "  scope          — 'material' | 'supplier' | 'global'\n"
+                "  entity_name    — material name, supplier name, or 'Global'\n"
+                "  risk_opportunity — 'risk' | 'opportunity'\n"
+                "  title          — concise headline (max 15 words)\n"
+                "  description    — 2-4 sentences of context, citing the article date "
+                "if it is recent (e.g. 'As of Feb 28 2026, ...'). "
+                "Mention which supplier(s) are affected and why.\n"
+                "  predicted_impact — single plain string (e.g. '10% cost increase by Q3')\n"
+                "  time_horizon   — 'short-term' | 'medium-term' | 'long-term'\n"
+                "  severity       — 'low' | 'medium' | 'high' | 'critical'\n"
+                "  recommended_actions — array of 3-5 plain action strings\n"
+                "  source_articles — array of article title strings used as evidence\n"
+                "  confidence     — float 0-1 (higher when article is recent and from "
+                "a credible source)\n\n"
+                "Return ONLY valid JSON — an array of insight objects. "
+                "No markdown, no prose outside the JSON array."
+            ),
+        ),
+        (
+            "user",
+            (
+                "OEM: {oem_name}\n\n"
+                "=== Suppliers context (with locations and commodities) ===\n"
+                "{suppliers_json}\n\n"
+                "=== Materials context ===\n"
+                "{materials_json}\n\n"
+                "=== Trend articles (most recent first, max 40) ===\n"
+                "{trend_items_json}\n\n"
+                "Today's date: {today_date}\n\n"
+                "Generate 10-15 trend insights covering all three scopes "
+                "(material, supplier, global). For each supplier-scope insight, "
+                "set entity_name to the EXACT supplier name from the list above. "
+                "Prioritise the most recent and highest-impact events, especially "
+                "those that directly affect a supplier's country or commodity. "
+                "Return a JSON array."
+            ),
+        ),
+    ]
+)
 
 
 async def _trend_insight_llm_node(state: TrendAgentState) -> TrendAgentState:
@@ -447,8 +440,7 @@ async def _trend_insight_llm_node(state: TrendAgentState) -> TrendAgentState:
         logger.warning("trend_insight_llm: no LLM configured")
         return {"insights": []}
 
-    prompt = _get_insight_prompt()
-    chain = prompt | llm
+    chain = _INSIGHT_PROMPT | llm
 
     # Sort items by recency (most recent first) before passing to the LLM
     def _pub_sort_key(item: dict) -> str:
@@ -7,25 +7,34 @@ for a shipment route between a supplier city and an OEM city.
 Graph structure
 ---------------
 
-    START
-      |
+                        START
+      +-------------------+-------------------+
+      v                   v                   v
+  [lookup_oem]     [lookup_supplier]   [fetch_tracking]  <- DB lookups + tracking API
+      |                   |                   |
+      +-------------------+-------------------+
       v
-  [resolve_cities]       <- extract supplier/OEM cities from scope (DB lookup)
+  [resolve_cities]       <- join: supplier/OEM cities, transit window, route plan
       |
       v
   [fetch_forecasts]      <- parallel forecast fetch for supplier + OEM cities
       |
       v
-  [build_daily_timeline] <- day-by-day weather + risk via compute_risk()
-      |
-      v
-  [build_exposure_risks] <- convert exposure payload into risk/opportunity dicts
+  [build_daily_timeline] <- day-by-day weather + risk via compute_risk_from_fields()
       |
-      v
-  [llm_summary]          <- optional LLM executive summary
-      |
-      v
-     END
+      +---------------------------+
+      v                           v
+  [build_exposure_risks]      [llm_summary]
+      |                           |
+      +-------------+-------------+
+                    v
+                   END
+
+  build_exposure_risks  <- convert exposure payload into risk/opportunity dicts
+  llm_summary           <- optional LLM executive summary
+
+Both branches only read ``exposure_payload``, so they run in parallel and
+the LLM latency overlaps with the local risk/opportunity construction.
 
 Public entrypoint: ``run_weather_graph(scope)``
 Returns ``{"risks": [...], "opportunities": [...]}`` ready for DB persistence.
@@ -34,31 +43,45 @@ Returns ``{"risks": [...], "opportunities": [...]}`` ready for DB persistence.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import random
+import re
+import sys
 import time
 import uuid as _uuid
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
-from typing import TypedDict
+from enum import Enum
+from operator import itemgetter
+from typing import Any, Callable, NamedTuple, TypedDict
 
 import httpx
-
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage, get_buffer_string
 from langchain_core.prompts import ChatPromptTemplate
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
+from pydantic import BaseModel
 
-from app.core.risk_engine import compute_risk
+from app.config import settings
+from app.core.risk_engine import compute_risk_from_fields
 from app.database import SessionLocal
 from app.schemas.weather_agent import (
     DayRiskSnapshot,
     DayWeatherSnapshot,
+    LegacyWeatherResult,
     RiskLevel,
     RiskSummary,
 )
+from app.services.agent_orchestrator import _extract_json
 from app.services.agent_types import OemScope
-from app.services.langchain_llm import get_chat_model
+from app.services.langchain_llm import get_chat_model, loop_scoped
 from app.services.llm_client import _persist_llm_log
 from app.services.oems import get_oem_by_id
 from app.services.suppliers import get_by_id as get_supplier_by_id
 from app.services.weather_service import (
+    _client_scope,
+    _response_json,
     get_current_weather,
     get_forecast,
     get_historical_weather,
@@ -67,15 +90,67 @@ from app.services.websocket_manager import manager as ws_manager
 
 logger = logging.getLogger(__name__)
 
+_perf = time.perf_counter
+
 # Default transit days when not determinable from metadata.
 DEFAULT_TRANSIT_DAYS = 7
+# Upper bound on concurrent WeatherAPI calls while building one timeline.
+DAY_FETCH_CONCURRENCY = 10
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize *data* as 2-space indented JSON for LLM prompts."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _dumps_compact(data: Any) -> str:
+    """Serialize *data* as whitespace-free UTF-8 JSON for token-lean LLM payloads."""
+    return orjson.dumps(data).decode()
+
+
+def _stable_hash(data: Any) -> str:
+    """Order-independent blake2b digest of a JSON-serializable value (cache keys)."""
+    raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _intern_text(value: Any) -> Any:
+    """Intern low-cardinality strings (cities, condition texts) repeated across days and shipments."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# In-process TTL caches are plain dicts of key -> (expiry_ts, value), the same
+# shape used by app.services.external_api_cache.
+
+
+def _ttl_cache_get(cache: dict[str, tuple[float, Any]], key: str) -> Any | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expiry, value = entry
+    if expiry < time.time():
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _ttl_cache_put(
+    cache: dict[str, tuple[float, Any]], key: str, value: Any,
+    ttl_seconds: float, max_entries: int,
+) -> None:
+    if key not in cache and len(cache) >= max_entries:
+        # Evict the oldest insertion (dicts preserve insertion order).
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (time.time() + ttl_seconds, value)
 
 
 # ---------------------------------------------------------------------------
 # Shipment tracking API helper
 # ---------------------------------------------------------------------------
 
-async def _fetch_shipment_tracking(supplier_id: str) -> dict | None:
+async def _fetch_shipment_tracking(
+    supplier_id: str, client: httpx.AsyncClient | None = None,
+) -> dict | None:
     """
     Fetch shipment tracking data from the mock API for a given supplier.
 
@@ -86,8 +161,7 @@ async def _fetch_shipment_tracking(supplier_id: str) -> dict | None:
     Returns None when the env var is missing, supplier_id is empty, or the
     call fails.
     """
-    from app.config import settings as _settings
-    base_url = _settings.mock_server_base_url
+    base_url = settings.mock_server_base_url
     if not supplier_id:
         logger.debug("[WeatherGraph] _fetch_shipment_tracking: supplier_id is empty — skipping")
         return None
@@ -100,10 +174,10 @@ async def _fetch_shipment_tracking(supplier_id: str) -> dict | None:
     url = f"{base_url.rstrip('/')}/mock/shipment-tracking"
     logger.info("[WeatherGraph] Fetching shipment tracking: supplier=%s url=%s", supplier_id, url)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(url, params={"q": f"supplier_id:{supplier_id}"})
+        async with _client_scope(client) as client:
+            r = await client.get(url, params={"q": f"supplier_id:{supplier_id}"}, timeout=10.0)
             r.raise_for_status()
-            data = r.json()
+            data = _response_json(r)
             items = data.get("items") or []
             if not items:
                 logger.warning(
@@ -132,23 +206,28 @@ async def _fetch_shipment_tracking(supplier_id: str) -> dict | None:
         return None
 
 
-def _get_city_for_date_from_route(
-    route_plan: list[dict], target_date: date
-) -> tuple[str, str] | None:
-    """
-    Return ``(city, transport_mode_of_next_leg)`` for *target_date* based on
-    the actual route plan waypoints.
+def _waypoint_sequence(wp: dict) -> Any:
+    return wp.get("sequence", 0)
 
-    Logic: the shipment is at the most recent waypoint whose arrival date
-    (actual or planned) is <= target_date.  The transport_mode of the *next*
-    waypoint describes how it travels out of that stop.
+
+class _RouteIndex(NamedTuple):
+    """A sequence-ordered route plan with arrival dates parsed once.
+
+    ``arrival_keys`` holds the running maximum of the waypoints' arrival
+    dates, so it is sorted and ``bisect_right`` finds how many waypoints the
+    shipment has reached — the same stop the original linear scan found,
+    which ended at the first arrival after the target date.
     """
-    sorted_plan = sorted(route_plan, key=lambda x: x.get("sequence", 0))
-    if not sorted_plan:
-        return None
+    arrival_keys: list[date]
+    stops: list[tuple[str, str]]  # (city, transport_mode of the next leg)
+    origin_city: str
+
 
-    current_idx = -1
-    for i, wp in enumerate(sorted_plan):
+def _build_route_index(route_plan: list[dict]) -> _RouteIndex:
+    arrival_keys: list[date] = []
+    stops: list[tuple[str, str]] = []
+    latest: date | None = None
+    for i, wp in enumerate(route_plan):
         arr_str = wp.get("actual_arrival") or wp.get("planned_arrival") or ""
         if not arr_str:
             continue
@@ -156,37 +235,78 @@ def _get_city_for_date_from_route(
             arr_date = date.fromisoformat(arr_str[:10])
         except ValueError:
             continue
-        if arr_date <= target_date:
-            current_idx = i
-        else:
-            break
+        latest = arr_date if latest is None or arr_date > latest else latest
+        # transport_mode of the NEXT leg (how we leave this waypoint)
+        next_mode = route_plan[i + 1].get("transport_mode", "") if i + 1 < len(route_plan) else ""
+        arrival_keys.append(latest)
+        stops.append((wp.get("location", {}).get("city", ""), next_mode))
+    origin_city = route_plan[0].get("location", {}).get("city", "") if route_plan else ""
+    return _RouteIndex(arrival_keys, stops, origin_city)
 
-    if current_idx == -1:
-        # Before any recorded arrival — use origin city
-        loc = sorted_plan[0].get("location", {})
-        return loc.get("city", ""), ""
 
-    wp = sorted_plan[current_idx]
-    city = wp.get("location", {}).get("city", "")
-    # transport_mode of the NEXT leg (how we leave this waypoint)
-    next_mode = ""
-    if current_idx + 1 < len(sorted_plan):
-        next_mode = sorted_plan[current_idx + 1].get("transport_mode", "")
-    return city, next_mode
+def _get_city_for_date_from_route(
+    route_index: _RouteIndex, target_date: date
+) -> tuple[str, str]:
+    """
+    Return ``(city, transport_mode_of_next_leg)`` for *target_date* based on
+    the actual route plan waypoints.
+
+    Logic: the shipment is at the most recent waypoint whose arrival date
+    (actual or planned) is <= target_date.  The transport_mode of the *next*
+    waypoint describes how it travels out of that stop.
+    """
+    reached = bisect_right(route_index.arrival_keys, target_date)
+    if not reached:
+        # Before any recorded arrival — use origin city
+        return route_index.origin_city, ""
+    return route_index.stops[reached - 1]
 
 
 # ---------------------------------------------------------------------------
 # Broadcast helper
 # ---------------------------------------------------------------------------
 
-async def _broadcast_progress(
+class _ProgressPublisher:
+    """
+    Sends queued progress events in order from one background task per
+    event loop, so graph nodes never wait on websocket sends.  Events queued
+    while a send is in flight go out together in the next batch.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[dict] = []
+        self._task: asyncio.Task | None = None
+
+    def publish(self, payload: dict) -> None:
+        self._pending.append(payload)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                await ws_manager.broadcast_many(batch)
+            except Exception:
+                logger.exception("[WeatherGraph] Progress broadcast failed")
+
+    async def flush(self) -> None:
+        """Wait until every event published so far has been sent."""
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+
+_progress_publishers: dict[asyncio.AbstractEventLoop, _ProgressPublisher] = {}
+
+
+def _broadcast_progress(
     step: str,
     message: str,
     details: dict | None = None,
     oem_name: str | None = None,
     supplier_name: str | None = None,
 ) -> None:
-    """Broadcast a weather agent progress event over websocket."""
+    """Queue a weather agent progress event for websocket broadcast."""
     payload: dict = {
         "type": "weather_agent_progress",
         "step": step,
@@ -198,7 +318,11 @@ async def _broadcast_progress(
         payload["supplierName"] = supplier_name
     if details:
         payload["details"] = details
-    await ws_manager.broadcast(payload)
+    loop_scoped(_progress_publishers, _ProgressPublisher).publish(payload)
+
+
+async def _flush_progress() -> None:
+    await loop_scoped(_progress_publishers, _ProgressPublisher).flush()
 
 
 # ---------------------------------------------------------------------------
@@ -207,6 +331,11 @@ async def _broadcast_progress(
 
 class WeatherState(TypedDict, total=False):
     scope: OemScope
+    # Pooled client shared by every HTTP call of the run (tracking + WeatherAPI);
+    # owned and closed by the entry point — the only client-ownership model:
+    # the weather_service cache runs each fetch on the caller's client.
+    # None → each call opens its own.
+    http_client: httpx.AsyncClient | None
 
     # Resolved city names (from DB or scope fallback)
     supplier_city: str
@@ -219,6 +348,10 @@ class WeatherState(TypedDict, total=False):
     # Shipment route plan from tracking API (actual waypoints)
     route_plan: list[dict] | None
 
+    # Shipment tracking item fetched alongside the DB lookups (tracking_data,
+    # supplier_name); read once by resolve_cities
+    tracking_item: dict | None
+
     # Forecast data fetched in parallel
     supplier_forecast: dict | None
     oem_forecast: dict | None
@@ -226,6 +359,7 @@ class WeatherState(TypedDict, total=False):
 
     # Day-by-day timeline built from weather data + risk engine
     day_results: list[dict]  # serialised DayRiskSnapshot dicts
+    day_snapshots: list[DayRiskSnapshot]  # the same days as models, for in-process callers
     exposure_payload: dict  # full risk_analysis_payload
 
     # Final outputs (DB-ready)
@@ -267,67 +401,95 @@ def _extract_peak_hourly_gust(fd: dict) -> float | None:
     return max(gusts) if gusts else None
 
 
+def _forecast_days_by_date(forecast_data: dict) -> dict[str, dict]:
+    """Index a forecast/history response's ``forecastday`` entries by date (first entry wins)."""
+    days_by_date: dict[str, dict] = {}
+    try:
+        for fd in forecast_data.get("forecast", {}).get("forecastday", []):
+            days_by_date.setdefault(fd.get("date"), fd)
+    except Exception as e:
+        logger.warning("Failed to index forecast days: %s", e)
+    return days_by_date
+
+
+def _day_snapshot_from_forecast_day(
+    fd: dict, target_date: str, day_number: int, location_label: str,
+    city_used: str, is_historical: bool, is_estimated: bool = False,
+) -> DayWeatherSnapshot:
+    day = fd.get("day", {})
+    cond = day.get("condition", {})
+    return DayWeatherSnapshot(
+        date=target_date, day_number=day_number,
+        location_name=location_label, estimated_location=city_used,
+        condition=_intern_text(cond.get("text", "Unknown")),
+        condition_code=int(cond.get("code", 1000)),
+        temp_c=float(day.get("avgtemp_c", 0)),
+        min_temp_c=float(day.get("mintemp_c", 0)),
+        max_temp_c=float(day.get("maxtemp_c", 0)),
+        wind_kph=float(day.get("maxwind_kph", 0)),
+        gust_kph=_extract_peak_hourly_gust(fd),
+        precip_mm=float(day.get("totalprecip_mm", 0)),
+        snow_cm=float(day.get("totalsnow_cm", 0)),
+        vis_km=float(day.get("avgvis_km", 10)),
+        humidity=int(day.get("avghumidity", 50)),
+        uv=float(day.get("uv", 0)) if day.get("uv") is not None else None,
+        is_historical=is_historical,
+        is_estimated=is_estimated,
+    )
+
+
 def _extract_day_weather_from_forecast(
-    forecast_data: dict, target_date: str, day_number: int,
+    days_by_date: dict[str, dict], target_date: str, day_number: int,
     location_label: str, city_used: str,
 ) -> DayWeatherSnapshot | None:
+    fd = days_by_date.get(target_date)
+    if fd is None:
+        return None
     try:
-        forecast_days = forecast_data.get("forecast", {}).get("forecastday", [])
-        for fd in forecast_days:
-            if fd.get("date") == target_date:
-                day = fd.get("day", {})
-                cond = day.get("condition", {})
-                peak_gust = _extract_peak_hourly_gust(fd)
-                return DayWeatherSnapshot(
-                    date=target_date, day_number=day_number,
-                    location_name=location_label, estimated_location=city_used,
-                    condition=cond.get("text", "Unknown"),
-                    condition_code=int(cond.get("code", 1000)),
-                    temp_c=float(day.get("avgtemp_c", 0)),
-                    min_temp_c=float(day.get("mintemp_c", 0)),
-                    max_temp_c=float(day.get("maxtemp_c", 0)),
-                    wind_kph=float(day.get("maxwind_kph", 0)),
-                    gust_kph=peak_gust,
-                    precip_mm=float(day.get("totalprecip_mm", 0)),
-                    snow_cm=float(day.get("totalsnow_cm", 0)),
-                    vis_km=float(day.get("avgvis_km", 10)),
-                    humidity=int(day.get("avghumidity", 50)),
-                    uv=float(day.get("uv", 0)) if day.get("uv") is not None else None,
-                    is_historical=False,
-                )
+        return _day_snapshot_from_forecast_day(
+            fd, target_date, day_number, location_label, city_used, is_historical=False,
+        )
     except Exception as e:
         logger.warning("Failed to extract forecast day for %s: %s", target_date, e)
     return None
 
 
+def _extract_day_weather_from_current(
+    raw: dict, target_date: str, day_number: int,
+    location_label: str, city_used: str,
+) -> DayWeatherSnapshot:
+    current = raw.get("current", {})
+    cond = current.get("condition", {})
+    return DayWeatherSnapshot(
+        date=target_date, day_number=day_number,
+        location_name=location_label, estimated_location=city_used,
+        condition=_intern_text(cond.get("text", "Unknown")),
+        condition_code=int(cond.get("code", 1000)),
+        temp_c=float(current.get("temp_c", 0)),
+        feelslike_c=float(current.get("feelslike_c", current.get("temp_c", 0))),
+        min_temp_c=None, max_temp_c=None,
+        wind_kph=float(current.get("wind_kph", 0)),
+        gust_kph=float(current.get("gust_kph", 0)) if current.get("gust_kph") else None,
+        precip_mm=float(current.get("precip_mm", 0)),
+        vis_km=float(current.get("vis_km", 10)),
+        humidity=int(current.get("humidity", 50)),
+        pressure_mb=float(current.get("pressure_mb", 0)) if current.get("pressure_mb") else None,
+        uv=float(current.get("uv", 0)) if current.get("uv") is not None else None,
+        is_historical=False,
+    )
+
+
 def _extract_day_weather_from_history(
     hist_data: dict, target_date: str, day_number: int,
     location_label: str, city_used: str,
 ) -> DayWeatherSnapshot | None:
+    fd = _forecast_days_by_date(hist_data).get(target_date)
+    if fd is None:
+        return None
     try:
-        forecast_days = hist_data.get("forecast", {}).get("forecastday", [])
-        for fd in forecast_days:
-            if fd.get("date") == target_date:
-                day = fd.get("day", {})
-                cond = day.get("condition", {})
-                peak_gust = _extract_peak_hourly_gust(fd)
-                return DayWeatherSnapshot(
-                    date=target_date, day_number=day_number,
-                    location_name=location_label, estimated_location=city_used,
-                    condition=cond.get("text", "Unknown"),
-                    condition_code=int(cond.get("code", 1000)),
-                    temp_c=float(day.get("avgtemp_c", 0)),
-                    min_temp_c=float(day.get("mintemp_c", 0)),
-                    max_temp_c=float(day.get("maxtemp_c", 0)),
-                    wind_kph=float(day.get("maxwind_kph", 0)),
-                    gust_kph=peak_gust,
-                    precip_mm=float(day.get("totalprecip_mm", 0)),
-                    snow_cm=float(day.get("totalsnow_cm", 0)),
-                    vis_km=float(day.get("avgvis_km", 10)),
-                    humidity=int(day.get("avghumidity", 50)),
-                    uv=float(day.get("uv", 0)) if day.get("uv") is not None else None,
-                    is_historical=True,
-                )
+        return _day_snapshot_from_forecast_day(
+            fd, target_date, day_number, location_label, city_used, is_historical=True,
+        )
     except Exception as e:
         logger.warning("Failed to extract history day for %s: %s", target_date, e)
     return None
@@ -347,50 +509,128 @@ def _get_last_forecast_day(
         forecast_days = forecast_data.get("forecast", {}).get("forecastday", [])
         if not forecast_days:
             return None
-        last = forecast_days[-1]
-        day = last.get("day", {})
-        cond = day.get("condition", {})
-        peak_gust = _extract_peak_hourly_gust(last)
-        return DayWeatherSnapshot(
-            date=target_date_str, day_number=day_number,
-            location_name=location_label, estimated_location=city_used,
-            condition=cond.get("text", "Unknown"),
-            condition_code=int(cond.get("code", 1000)),
-            temp_c=float(day.get("avgtemp_c", 0)),
-            min_temp_c=float(day.get("mintemp_c", 0)),
-            max_temp_c=float(day.get("maxtemp_c", 0)),
-            wind_kph=float(day.get("maxwind_kph", 0)),
-            gust_kph=peak_gust,
-            precip_mm=float(day.get("totalprecip_mm", 0)),
-            snow_cm=float(day.get("totalsnow_cm", 0)),
-            vis_km=float(day.get("avgvis_km", 10)),
-            humidity=int(day.get("avghumidity", 50)),
-            uv=float(day.get("uv", 0)) if day.get("uv") is not None else None,
-            is_historical=False,
-            is_estimated=True,
+        return _day_snapshot_from_forecast_day(
+            forecast_days[-1], target_date_str, day_number, location_label, city_used,
+            is_historical=False, is_estimated=True,
         )
     except Exception as e:
         logger.warning("Failed to get last forecast day for %s: %s", target_date_str, e)
     return None
 
 
-def _weather_snapshot_to_current_dict(snap: DayWeatherSnapshot) -> dict:
-    """Convert a DayWeatherSnapshot into the dict format expected by compute_risk().
+def _beyond_window_snapshot(
+    forecast_data: dict, day_number: int, location_label: str,
+    city_used: str, target_date_str: str,
+) -> DayWeatherSnapshot | None:
+    """Last resort: date is beyond 14-day API window — use last available day as estimate."""
+    logger.info(
+        "[WeatherGraph] Day %d (%s) beyond forecast window — "
+        "using last available forecast day for %s",
+        day_number, target_date_str, city_used,
+    )
+    return _get_last_forecast_day(
+        forecast_data, day_number, location_label, city_used, target_date_str,
+    )
+
+
+class _RiskInputs(NamedTuple):
+    """The DayWeatherSnapshot fields that feed compute_risk_from_fields().
+
+    Hashable, so it doubles as the per-run risk cache key.
+    """
+    temp_c: float
+    feelslike_c: float | None
+    wind_kph: float
+    gust_kph: float | None
+    precip_mm: float
+    vis_km: float
+    humidity: int
+    uv: float | None
+    condition_code: int
+    condition: str
+
+
+def _risk_inputs(snap: DayWeatherSnapshot) -> _RiskInputs:
+    return _RiskInputs(
+        snap.temp_c, snap.feelslike_c, snap.wind_kph, snap.gust_kph,
+        snap.precip_mm, snap.vis_km, snap.humidity, snap.uv,
+        snap.condition_code, snap.condition,
+    )
+
+
+def _score_risk_inputs(inp: _RiskInputs) -> dict:
+    """Score risk inputs with compute_risk_from_fields().
 
     Uses actual condition codes, gust data, and feels-like temperature when
     available — previously these were hardcoded, causing the risk engine to
     miss snow/ice, storms, and extreme wind conditions entirely.
     """
+    return compute_risk_from_fields(
+        temp_c=inp.temp_c,
+        feelslike_c=inp.feelslike_c if inp.feelslike_c is not None else inp.temp_c,
+        wind_kph=inp.wind_kph,
+        gust_kph=inp.gust_kph if inp.gust_kph is not None else inp.wind_kph * 1.3,
+        precip_mm=inp.precip_mm,
+        vis_km=inp.vis_km,
+        humidity=inp.humidity,
+        uv=inp.uv,
+        condition_code=inp.condition_code,
+    )
+
+
+def _serialize_risk(risk_raw: dict) -> dict:
+    """Convert compute_risk() output into plain dicts with enums unwrapped to ``.value``."""
+    factors_serialized = [
+        f.model_dump() if isinstance(f, BaseModel) else f
+        for f in risk_raw.get("factors", [])
+    ]
+    risk_dict_serialized = {**risk_raw, "factors": factors_serialized}
+    level = risk_dict_serialized.get("overall_level")
+    if isinstance(level, Enum):
+        risk_dict_serialized["overall_level"] = level.value
+    for f in factors_serialized:
+        level = f.get("level")
+        if isinstance(level, Enum):
+            f["level"] = level.value
+    return risk_dict_serialized
+
+
+def _extend_unique(out: list[str], seen: set[str], items: list[str], limit: int) -> None:
+    """Append items not already in *seen* to *out* until it holds *limit* entries."""
+    for item in items:
+        if len(out) >= limit:
+            return
+        if item in seen:
+            continue
+        seen.add(item)
+        out.append(item)
+
+
+def _timeline_row(d: dict) -> dict:
+    """Project a dumped DayRiskSnapshot into its ``exposure_payload["daily_timeline"]`` entry."""
+    w = d["weather"]
+    r = d["risk"]
+    concerns = r["primary_concerns"]
     return {
-        "temp_c": snap.temp_c,
-        "feelslike_c": snap.feelslike_c if snap.feelslike_c is not None else snap.temp_c,
-        "wind_kph": snap.wind_kph,
-        "gust_kph": snap.gust_kph if snap.gust_kph is not None else snap.wind_kph * 1.3,
-        "precip_mm": snap.precip_mm,
-        "vis_km": snap.vis_km,
-        "humidity": snap.humidity,
-        "uv": snap.uv,
-        "condition": {"code": snap.condition_code, "text": snap.condition},
+        "day": d["day_number"], "date": d["date"],
+        "location": d["location_name"],
+        "is_historical": w["is_historical"],
+        "is_estimated": w["is_estimated"],
+        "weather": {
+            "condition": w["condition"],
+            "condition_code": w["condition_code"],
+            "temp_c": w["temp_c"],
+            "feelslike_c": w["feelslike_c"],
+            "wind_kph": w["wind_kph"],
+            "gust_kph": w["gust_kph"],
+            "precip_mm": w["precip_mm"],
+            "snow_cm": w["snow_cm"],
+            "vis_km": w["vis_km"],
+            "humidity": w["humidity"],
+        },
+        "risk_score": r["overall_score"],
+        "risk_level": r["overall_level"].value,
+        "key_concern": concerns[0] if concerns else "No significant risk",
     }
 
 
@@ -398,105 +638,129 @@ def _weather_snapshot_to_current_dict(snap: DayWeatherSnapshot) -> dict:
 # Node 1: Resolve cities from scope / DB
 # ---------------------------------------------------------------------------
 
-async def _resolve_cities_node(state: WeatherState) -> WeatherState:
+def _lookup_entity_sync(
+    getter: Callable[[Any, _uuid.UUID], Any], id_str: str,
+) -> tuple[str | None, str]:
     """
-    Resolve supplier and OEM city names by looking up the DB directly
-    using oemId / supplierId from the scope (same pattern as news agent).
+    Blocking DB lookup of one OEM/supplier's ``(city, name)``.  Runs in a
+    worker thread so the event loop keeps serving other graphs, the tracking
+    fetch and websocket traffic meanwhile.
     """
+    db = SessionLocal()
+    try:
+        obj = getter(db, _uuid.UUID(id_str))
+        if not obj:
+            return None, ""
+        city = (
+            getattr(obj, "city", None)
+            or getattr(obj, "location", None)
+            or getattr(obj, "country", None)
+        )
+        name = getattr(obj, "name", None) or getattr(obj, "company_name", None) or ""
+        return city, name
+    finally:
+        db.close()
+
+
+async def _lookup_oem_node(state: WeatherState) -> WeatherState:
+    """Fork leg: the OEM's city (and name, when the scope has none) from the DB."""
     scope = state["scope"]
     oem_name: str = scope.get("oemName") or ""
-    supplier_name: str = scope.get("supplierName") or ""
-
     oem_city: str | None = None
+    oem_id_str = scope.get("oemId")
+    if oem_id_str:
+        oem_city, db_name = await asyncio.to_thread(_lookup_entity_sync, get_oem_by_id, oem_id_str)
+        oem_name = oem_name or db_name
+    return {"oem_city": oem_city or "", "oem_name": oem_name}
+
+
+async def _lookup_supplier_node(state: WeatherState) -> WeatherState:
+    """Fork leg: the supplier's city (and name, when the scope has none) from the DB."""
+    scope = state["scope"]
+    supplier_name: str = scope.get("supplierName") or ""
     supplier_city: str | None = None
+    supplier_id_str = scope.get("supplierId")
+    if supplier_id_str:
+        supplier_city, db_name = await asyncio.to_thread(
+            _lookup_entity_sync, get_supplier_by_id, supplier_id_str,
+        )
+        supplier_name = supplier_name or db_name
+    return {"supplier_city": supplier_city or "", "supplier_name": supplier_name}
+
+
+async def _fetch_tracking_node(state: WeatherState) -> WeatherState:
+    """Fork leg: shipment tracking for the scope's supplier (None when unavailable)."""
+    supplier_id_str = state["scope"].get("supplierId")
+    if not supplier_id_str:
+        return {"tracking_item": None}
+    return {
+        "tracking_item": await _fetch_shipment_tracking(supplier_id_str, state.get("http_client")),
+    }
 
-    db = SessionLocal()
-    try:
-        oem_id_str = scope.get("oemId")
-        supplier_id_str = scope.get("supplierId")
-        if oem_id_str:
-            from uuid import UUID
-            oem_obj = get_oem_by_id(db, UUID(oem_id_str))
-            if oem_obj:
-                oem_city = (
-                    getattr(oem_obj, "city", None)
-                    or getattr(oem_obj, "location", None)
-                    or getattr(oem_obj, "country", None)
-                )
-                if not oem_name:
-                    oem_name = (
-                        getattr(oem_obj, "name", None)
-                        or getattr(oem_obj, "company_name", None)
-                        or ""
-                    )
-        if supplier_id_str:
-            from uuid import UUID
-            sup_obj = get_supplier_by_id(db, UUID(supplier_id_str))
-            if sup_obj:
-                supplier_city = (
-                    getattr(sup_obj, "city", None)
-                    or getattr(sup_obj, "location", None)
-                    or getattr(sup_obj, "country", None)
-                )
-                if not supplier_name:
-                    supplier_name = (
-                        getattr(sup_obj, "name", None)
-                        or getattr(sup_obj, "company_name", None)
-                        or ""
-                    )
-    finally:
-        db.close()
+
+async def _resolve_cities_node(state: WeatherState) -> WeatherState:
+    """
+    Join the fork legs: supplier and OEM cities looked up from the DB
+    using oemId / supplierId from the scope (same pattern as news agent),
+    plus the transit window and route plan from shipment tracking.
+    """
+    oem_city = state.get("oem_city")
+    supplier_city = state.get("supplier_city")
+    oem_name = state.get("oem_name") or ""
+    supplier_name = state.get("supplier_name") or ""
 
     logger.info(
         "[WeatherGraph] DB lookup: oem=%r city=%s supplier=%r city=%s",
         oem_name or "?", oem_city or "?", supplier_name or "?", supplier_city or "?",
     )
 
-    # Always try the shipment tracking API when supplier_id is available:
+    # Shipment tracking (fetched whenever supplier_id is available):
     #   - fills transit_days / shipment_start_date (if not pre-set by caller)
     #   - always fills route_plan for route-aware weather analysis
     transit_days = state.get("transit_days") or 0
     shipment_start_date = state.get("shipment_start_date") or ""
     route_plan: list[dict] | None = None
 
-    if supplier_id_str:
-        item_data = await _fetch_shipment_tracking(supplier_id_str)
-        if item_data:
-            # Supplier name from tracking data (more reliable than DB for display)
-            if not supplier_name:
-                supplier_name = item_data.get("supplier_name") or ""
-            tracking = item_data.get("tracking_data") or {}
-            meta = tracking.get("shipment_meta") or {}
-            if not transit_days:
-                transit_days = int(meta.get("transit_days_estimated") or 0)
-            if not shipment_start_date:
-                pickup_raw = meta.get("pickup_date") or ""
-                shipment_start_date = pickup_raw[:10] if pickup_raw else ""
-            route_plan = tracking.get("route_plan") or None
-            logger.info(
-                "[WeatherGraph] Tracking resolved: transit_days=%d start=%s "
-                "route_stops=%d supplier_name=%r",
-                transit_days, shipment_start_date,
-                len(route_plan) if route_plan else 0,
-                supplier_name,
-            )
-            if route_plan:
-                for wp in sorted(route_plan, key=lambda x: x.get("sequence", 0)):
-                    loc = wp.get("location", {})
-                    logger.info(
-                        "[WeatherGraph]   waypoint seq=%s status=%-9s city=%s mode=%s",
-                        wp.get("sequence", "?"),
-                        wp.get("status", "?"),
-                        loc.get("city", "?"),
-                        wp.get("transport_mode", "?"),
-                    )
+    item_data = state.get("tracking_item")
+    if item_data:
+        # Supplier name from tracking data (more reliable than DB for display)
+        if not supplier_name:
+            supplier_name = item_data.get("supplier_name") or ""
+        tracking = item_data.get("tracking_data") or {}
+        meta = tracking.get("shipment_meta") or {}
+        if not transit_days:
+            transit_days = int(meta.get("transit_days_estimated") or 0)
+        if not shipment_start_date:
+            pickup_raw = meta.get("pickup_date") or ""
+            shipment_start_date = pickup_raw[:10] if pickup_raw else ""
+        route_plan = tracking.get("route_plan") or None
+        if route_plan:
+            # Sorted once here; every later pass relies on sequence order.
+            route_plan = sorted(route_plan, key=_waypoint_sequence)
+        logger.info(
+            "[WeatherGraph] Tracking resolved: transit_days=%d start=%s "
+            "route_stops=%d supplier_name=%r",
+            transit_days, shipment_start_date,
+            len(route_plan) if route_plan else 0,
+            supplier_name,
+        )
+        if route_plan:
+            for wp in route_plan:
+                loc = wp.get("location", {})
+                logger.info(
+                    "[WeatherGraph]   waypoint seq=%s status=%-9s city=%s mode=%s",
+                    wp.get("sequence", "?"),
+                    wp.get("status", "?"),
+                    loc.get("city", "?"),
+                    wp.get("transport_mode", "?"),
+                )
 
     if not oem_city or not supplier_city:
         logger.warning(
             "[WeatherGraph] Cannot resolve cities (oem_city=%s, supplier_city=%s) — skipping",
             oem_city, supplier_city,
         )
-        await _broadcast_progress(
+        _broadcast_progress(
             "resolve_cities_skipped",
             "Cannot resolve supplier/OEM cities — skipping weather analysis",
             oem_name=oem_name or "Unknown OEM",
@@ -528,7 +792,7 @@ async def _resolve_cities_node(state: WeatherState) -> WeatherState:
         transit_days, shipment_start_date,
         "yes" if route_plan else "no",
     )
-    await _broadcast_progress(
+    _broadcast_progress(
         "resolve_cities",
         f"Route: {supplier_city} → {oem_city} ({transit_days} days) via {len(route_plan) if route_plan else 0} stops",
         {"supplier_city": supplier_city, "oem_city": oem_city, "transit_days": transit_days,
@@ -559,6 +823,7 @@ async def _fetch_forecasts_node(state: WeatherState) -> WeatherState:
     route_plan = state.get("route_plan")
     oem_name = state.get("oem_name")
     supplier_name = state.get("supplier_name")
+    http_client = state.get("http_client")
 
     if not supplier_city or not oem_city:
         logger.info("[WeatherGraph] Cities not resolved — skipping forecast fetch")
@@ -571,18 +836,21 @@ async def _fetch_forecasts_node(state: WeatherState) -> WeatherState:
     forecast_days_needed = min(forecast_days_needed + 1, 14)
 
     # Collect all unique cities to fetch: supplier + oem + all route waypoints
+    # (supplier and oem keep slots 0 and 1 even when they are the same city).
     ordered_cities: list[str] = [supplier_city, oem_city]
     if route_plan:
-        for wp in sorted(route_plan, key=lambda x: x.get("sequence", 0)):
+        seen_cities = set(ordered_cities)
+        for wp in route_plan:
             city = wp.get("location", {}).get("city") or ""
-            if city and city not in ordered_cities:
+            if city and city not in seen_cities:
+                seen_cities.add(city)
                 ordered_cities.append(city)
 
     logger.info(
         "[WeatherGraph] Fetching forecasts for %d cities: %s (days=%d)",
         len(ordered_cities), ordered_cities, forecast_days_needed,
     )
-    await _broadcast_progress(
+    _broadcast_progress(
         "fetch_forecasts",
         f"Fetching weather forecasts for {len(ordered_cities)} route cities",
         {"cities": ordered_cities, "forecast_days": forecast_days_needed},
@@ -591,7 +859,10 @@ async def _fetch_forecasts_node(state: WeatherState) -> WeatherState:
 
     try:
         results = await asyncio.gather(
-            *[get_forecast(city, days=forecast_days_needed) for city in ordered_cities],
+            *[
+                get_forecast(city, days=forecast_days_needed, client=http_client)
+                for city in ordered_cities
+            ],
             return_exceptions=True,
         )
         supplier_forecast = results[0] if not isinstance(results[0], BaseException) else None
@@ -606,14 +877,14 @@ async def _fetch_forecasts_node(state: WeatherState) -> WeatherState:
             "[WeatherGraph] Forecasts fetched: %d/%d cities ok",
             sum(1 for r in results if isinstance(r, dict)), len(ordered_cities),
         )
-        await _broadcast_progress(
+        _broadcast_progress(
             "fetch_forecasts_done",
             f"Weather forecasts retrieved for {len(route_city_forecasts)} cities",
             oem_name=oem_name, supplier_name=supplier_name,
         )
     except Exception as exc:
         logger.exception("[WeatherGraph] Forecast fetch error: %s", exc)
-        await _broadcast_progress(
+        _broadcast_progress(
             "fetch_forecasts_error", f"Forecast fetch error: {exc}",
             oem_name=oem_name, supplier_name=supplier_name,
         )
@@ -643,6 +914,7 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
     oem_forecast = state.get("oem_forecast")
     oem_name = state.get("oem_name")
     supplier_name = state.get("supplier_name")
+    http_client = state.get("http_client")
 
     route_plan = state.get("route_plan")
     route_city_forecasts = state.get("route_city_forecasts") or {}
@@ -652,10 +924,14 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
 
     # Use actual route waypoints when available, otherwise fall back to interpolation
     use_route = bool(route_plan)
-    if not use_route:
+    if use_route:
+        # route_plan is in sequence order (sorted in _resolve_cities_node).
+        origin_wp, dest_wp = route_plan[0], route_plan[-1]
+        route_index = _build_route_index(route_plan)
+    else:
         waypoints = _interpolate_waypoints(supplier_city, oem_city, transit_days)
 
-    await _broadcast_progress(
+    _broadcast_progress(
         "build_timeline",
         f"Analyzing {transit_days}-day weather timeline"
         + (f" across {len(route_plan)} route stops" if route_plan else ""),
@@ -663,37 +939,46 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
         oem_name=oem_name, supplier_name=supplier_name,
     )
 
-    day_results: list[DayRiskSnapshot] = []
+    # Pass 1: place each day on the route and pick its data source.  Future
+    # days are resolved from the pre-fetched forecasts right away; a city
+    # missing from them gets one fresh 14-day forecast in pass 2, and every
+    # later day at that city waits for it.
+    # (day_number, date, location label, city, kind)
+    day_plans: list[tuple[int, str, str, str, str]] = []
+    day_snaps: dict[int, DayWeatherSnapshot | None] = {}
+    fresh_cities: dict[str, None] = {}  # first-seen order
+    midpoint = transit_days // 2
+
+    # Each forecast response is indexed by date once, on first use.
+    forecast_indexes: dict[int, dict[str, dict]] = {}
+
+    def days_by_date(forecast_data: dict) -> dict[str, dict]:
+        index = forecast_indexes.get(id(forecast_data))
+        if index is None:
+            index = forecast_indexes[id(forecast_data)] = _forecast_days_by_date(forecast_data)
+        return index
 
     for i in range(transit_days):
         day_number = i + 1
         target_date = start_date + timedelta(days=i)
         target_date_str = target_date.strftime("%Y-%m-%d")
 
-        is_past = target_date < today
-        is_today = target_date == today
-
         # --- Determine city and location label for this day ---
         if use_route:
-            sorted_route = sorted(route_plan, key=lambda x: x.get("sequence", 0))
             if i == 0:
                 # Always force origin = first route waypoint (ignore arrival-date logic)
-                origin_wp = sorted_route[0]
                 waypoint_city = origin_wp.get("location", {}).get("city", "") or supplier_city
                 transport_mode = ""
                 location_label = f"{waypoint_city} (Origin)"
             elif i == transit_days - 1:
                 # Always force destination = last route waypoint
-                dest_wp = sorted_route[-1]
                 waypoint_city = dest_wp.get("location", {}).get("city", "") or oem_city
                 transport_mode = ""
                 location_label = f"{waypoint_city} (Destination)"
             else:
-                route_result = _get_city_for_date_from_route(route_plan, target_date)
-                if route_result:
-                    waypoint_city, transport_mode = route_result
-                else:
-                    waypoint_city, transport_mode = supplier_city, ""
+                waypoint_city, transport_mode = _get_city_for_date_from_route(
+                    route_index, target_date,
+                )
                 if transport_mode:
                     location_label = f"In Transit via {transport_mode} - Day {day_number}"
                 else:
@@ -708,66 +993,105 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
             else:
                 location_label = f"In Transit - Day {day_number}"
 
-        weather_snap: DayWeatherSnapshot | None = None
-        city_used = waypoint_city
-
-        if is_today:
-            raw = await get_current_weather(waypoint_city)
-            if raw:
-                current = raw.get("current", {})
-                cond = current.get("condition", {})
-                weather_snap = DayWeatherSnapshot(
-                    date=target_date_str, day_number=day_number,
-                    location_name=location_label, estimated_location=city_used,
-                    condition=cond.get("text", "Unknown"),
-                    condition_code=int(cond.get("code", 1000)),
-                    temp_c=float(current.get("temp_c", 0)),
-                    feelslike_c=float(current.get("feelslike_c", current.get("temp_c", 0))),
-                    min_temp_c=None, max_temp_c=None,
-                    wind_kph=float(current.get("wind_kph", 0)),
-                    gust_kph=float(current.get("gust_kph", 0)) if current.get("gust_kph") else None,
-                    precip_mm=float(current.get("precip_mm", 0)),
-                    vis_km=float(current.get("vis_km", 10)),
-                    humidity=int(current.get("humidity", 50)),
-                    pressure_mb=float(current.get("pressure_mb", 0)) if current.get("pressure_mb") else None,
-                    uv=float(current.get("uv", 0)) if current.get("uv") is not None else None,
-                    is_historical=False,
+        city_used = _intern_text(waypoint_city)
+        if target_date == today:
+            kind = "current"
+        elif target_date < today:
+            kind = "history"
+        else:
+            kind = "forecast"
+        day_plans.append((day_number, target_date_str, location_label, city_used, kind))
+
+        if kind != "forecast" or city_used in fresh_cities:
+            continue
+        # Try route-specific forecast first, then supplier/oem fallback
+        forecast_data = route_city_forecasts.get(city_used)
+        if not forecast_data:
+            forecast_data = supplier_forecast if i < midpoint else oem_forecast
+        weather_snap = None
+        if forecast_data:
+            weather_snap = _extract_day_weather_from_forecast(
+                days_by_date(forecast_data), target_date_str, day_number, location_label, city_used,
+            )
+        # Fresh fetch only when city is truly missing from our pre-fetched cache
+        if not weather_snap and city_used not in route_city_forecasts:
+            fresh_cities[city_used] = None
+            continue
+        if not weather_snap and forecast_data:
+            weather_snap = _beyond_window_snapshot(
+                forecast_data, day_number, location_label, city_used, target_date_str,
+            )
+        day_snaps[day_number] = weather_snap
+
+    # Pass 2: fetch current/historical days and missing forecasts concurrently.
+    fetch_keys: list[tuple[str, str, str]] = []  # (kind, city, date)
+    fetch_coros = []
+    for day_number, target_date_str, _label, city_used, kind in day_plans:
+        if kind == "current":
+            fetch_keys.append((kind, city_used, target_date_str))
+            fetch_coros.append(get_current_weather(city_used, client=http_client))
+        elif kind == "history":
+            fetch_keys.append((kind, city_used, target_date_str))
+            fetch_coros.append(
+                get_historical_weather(city_used, target_date_str, client=http_client)
+            )
+    for city in fresh_cities:
+        fetch_keys.append(("forecast", city, ""))
+        fetch_coros.append(get_forecast(city, days=14, client=http_client))
+
+    fetched: dict[tuple[str, str, str], dict | None] = {}
+    if fetch_coros:
+        semaphore = asyncio.Semaphore(DAY_FETCH_CONCURRENCY)
+
+        async def _bounded(coro):
+            async with semaphore:
+                return await coro
+
+        results = await asyncio.gather(
+            *[_bounded(c) for c in fetch_coros], return_exceptions=True,
+        )
+        for key, result in zip(fetch_keys, results):
+            if isinstance(result, BaseException):
+                logger.warning("[WeatherGraph] %s fetch failed for %s %s: %s", *key, result)
+                result = None
+            fetched[key] = result
+
+    # Pass 3: build the snapshots in day order.
+    # (day_number, date, location label, weather, risk inputs) for every day
+    # with data; risk scoring runs once over all of them below.
+    resolved_days: list[tuple[int, str, str, DayWeatherSnapshot, _RiskInputs]] = []
+    for day_number, target_date_str, location_label, city_used, kind in day_plans:
+        if kind == "current":
+            raw = fetched.get((kind, city_used, target_date_str))
+            weather_snap = (
+                _extract_day_weather_from_current(
+                    raw, target_date_str, day_number, location_label, city_used,
                 )
-        elif is_past:
-            hist_data = await get_historical_weather(waypoint_city, target_date_str)
-            if hist_data:
-                weather_snap = _extract_day_weather_from_history(
+                if raw else None
+            )
+        elif kind == "history":
+            hist_data = fetched.get((kind, city_used, target_date_str))
+            weather_snap = (
+                _extract_day_weather_from_history(
                     hist_data, target_date_str, day_number, location_label, city_used,
                 )
+                if hist_data else None
+            )
+        elif day_number in day_snaps:
+            weather_snap = day_snaps[day_number]
         else:
-            # Try route-specific forecast first, then supplier/oem fallback
-            forecast_data = route_city_forecasts.get(waypoint_city)
+            forecast_data = fetched.get(("forecast", city_used, ""))
             if not forecast_data:
-                midpoint = transit_days // 2
-                forecast_data = supplier_forecast if i < midpoint else oem_forecast
+                forecast_data = supplier_forecast if day_number - 1 < midpoint else oem_forecast
+            weather_snap = None
             if forecast_data:
                 weather_snap = _extract_day_weather_from_forecast(
-                    forecast_data, target_date_str, day_number, location_label, city_used,
+                    days_by_date(forecast_data), target_date_str, day_number, location_label, city_used,
                 )
-            # Fresh fetch only when city is truly missing from our pre-fetched cache
-            if not weather_snap and waypoint_city not in route_city_forecasts:
-                fresh_forecast = await get_forecast(waypoint_city, days=14)
-                if fresh_forecast:
-                    route_city_forecasts[waypoint_city] = fresh_forecast  # cache it
-                    forecast_data = fresh_forecast
-                    weather_snap = _extract_day_weather_from_forecast(
-                        fresh_forecast, target_date_str, day_number, location_label, city_used,
+                if not weather_snap:
+                    weather_snap = _beyond_window_snapshot(
+                        forecast_data, day_number, location_label, city_used, target_date_str,
                     )
-            # Last resort: date is beyond 14-day API window — use last available day as estimate
-            if not weather_snap and forecast_data:
-                logger.info(
-                    "[WeatherGraph] Day %d (%s) beyond forecast window — "
-                    "using last available forecast day for %s",
-                    day_number, target_date_str, city_used,
-                )
-                weather_snap = _get_last_forecast_day(
-                    forecast_data, day_number, location_label, city_used, target_date_str,
-                )
 
         if not weather_snap:
             logger.warning(
@@ -776,21 +1100,31 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
             )
             continue
 
-        current_dict = _weather_snapshot_to_current_dict(weather_snap)
-        risk_raw = compute_risk({"current": current_dict})
-        factors_serialized = [
-            f.model_dump() if hasattr(f, "model_dump") else f
-            for f in risk_raw.get("factors", [])
-        ]
-        risk_dict_serialized = {**risk_raw, "factors": factors_serialized}
-        if hasattr(risk_dict_serialized.get("overall_level"), "value"):
-            risk_dict_serialized["overall_level"] = risk_dict_serialized["overall_level"].value
-        for f in risk_dict_serialized["factors"]:
-            if hasattr(f.get("level"), "value"):
-                f["level"] = f["level"].value
+        resolved_days.append(
+            (day_number, target_date_str, location_label, weather_snap, _risk_inputs(weather_snap))
+        )
 
-        risk_summary = RiskSummary(**risk_dict_serialized)
+    # Days with identical weather inputs score identically — score, serialize
+    # and validate each distinct input once, in a single batch.  The
+    # RiskSummary is only read downstream, so the same instance is shared
+    # across those days.
+    unique_inputs = list(dict.fromkeys(day[-1] for day in resolved_days))
+    risk_by_input: dict[_RiskInputs, RiskSummary] = {
+        inp: RiskSummary(**_serialize_risk(_score_risk_inputs(inp))) for inp in unique_inputs
+    }
+    # Dumped once per distinct summary too; days sharing it share the
+    # (read-only) dict.
+    risk_dumps: dict[_RiskInputs, dict] = {
+        inp: risk.model_dump() for inp, risk in risk_by_input.items()
+    }
 
+    # Each day's dict form (DayRiskSnapshot.model_dump() layout) is assembled
+    # from its parts rather than dumped from the model; it feeds both the state
+    # transport (day_results) and the daily_timeline projection.
+    day_results: list[DayRiskSnapshot] = []
+    day_results_dicts: list[dict] = []
+    for day_number, target_date_str, location_label, weather_snap, risk_key in resolved_days:
+        risk_summary = risk_by_input[risk_key]
         concern_text = (
             risk_summary.primary_concerns[0]
             if risk_summary.primary_concerns
@@ -809,32 +1143,55 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
                 risk=risk_summary, risk_summary_text=risk_summary_text,
             )
         )
+        day_results_dicts.append({
+            "date": target_date_str, "day_number": day_number,
+            "location_name": location_label, "weather": weather_snap.model_dump(),
+            "risk": risk_dumps[risk_key], "risk_summary_text": risk_summary_text,
+        })
 
-    # Build exposure payload
-    all_scores = [d.risk.overall_score for d in day_results]
-    avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
-    max_score = max(all_scores) if all_scores else 0
-    exposure_score = round(max_score * 0.5 + avg_score * 0.5, 1) if all_scores else 0.0
-
-    peak_risk_day = max(day_results, key=lambda d: d.risk.overall_score) if day_results else None
-    high_risk_days = [
-        d for d in day_results
-        if d.risk.overall_level in (RiskLevel.HIGH, RiskLevel.CRITICAL)
-    ]
-
+    # Aggregate scores, peak day, high-risk days and concerns/actions in a
+    # single pass over day_results.
     factor_names = ["transportation", "power_outage", "production", "port_and_route", "raw_material_delay"]
+    # Factor maxima only depend on the distinct summaries, so they are taken
+    # over risk_by_input rather than over every day.
     factor_max_scores: dict[str, float] = {f: 0.0 for f in factor_names}
-    for d in day_results:
-        for factor in d.risk.factors:
-            fn = factor.factor
-            if fn in factor_max_scores:
-                factor_max_scores[fn] = max(factor_max_scores[fn], factor.score)
-
-    all_concerns: list[str] = []
-    all_actions: list[str] = []
-    for d in day_results:
-        all_concerns.extend(d.risk.primary_concerns)
-        all_actions.extend(d.risk.suggested_actions)
+    fmax = factor_max_scores
+    for risk in risk_by_input.values():
+        for factor in risk.factors:
+            fn, score = factor.factor, factor.score
+            prev = fmax.get(fn)
+            if prev is not None and score > prev:
+                fmax[fn] = score
+    sum_score = 0.0
+    max_score = -1.0
+    peak_risk_day: DayRiskSnapshot | None = None
+    high_risk_dates: list[str] = []
+    # Deduplicated (first-seen order) and capped at 6 while aggregating, so the
+    # full concern/action lists are never materialised.
+    top_concerns: list[str] = []
+    top_actions: list[str] = []
+    seen_concerns: set[str] = set()
+    seen_actions: set[str] = set()
+    daily_timeline: list[dict] = []
+    for d, dumped in zip(day_results, day_results_dicts):
+        risk = d.risk
+        daily_timeline.append(_timeline_row(dumped))
+        score = risk.overall_score
+        sum_score += score
+        if score > max_score:
+            max_score = score
+            peak_risk_day = d
+        if risk.overall_level in (RiskLevel.HIGH, RiskLevel.CRITICAL):
+            high_risk_dates.append(d.date)
+        _extend_unique(top_concerns, seen_concerns, risk.primary_concerns, 6)
+        _extend_unique(top_actions, seen_actions, risk.suggested_actions, 6)
+
+    if day_results:
+        avg_score = sum_score / len(day_results)
+        exposure_score = round(max_score * 0.5 + avg_score * 0.5, 1)
+    else:
+        avg_score = 0
+        exposure_score = 0.0
 
     exposure_payload = {
         "shipment_metadata": {
@@ -848,59 +1205,34 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
             "peak_risk_score": round(peak_risk_day.risk.overall_score, 1) if peak_risk_day else 0,
             "peak_risk_day": peak_risk_day.day_number if peak_risk_day else None,
             "peak_risk_date": peak_risk_day.date if peak_risk_day else None,
-            "high_risk_day_count": len(high_risk_days),
-            "high_risk_dates": [d.date for d in high_risk_days],
+            "high_risk_day_count": len(high_risk_dates),
+            "high_risk_dates": high_risk_dates,
             "overall_exposure_score": exposure_score,
         },
         "risk_factors_max": factor_max_scores,
-        "primary_concerns": list(dict.fromkeys(all_concerns))[:6],
-        "recommended_actions": list(dict.fromkeys(all_actions))[:6],
-        "daily_timeline": [
-            {
-                "day": d.day_number, "date": d.date,
-                "location": d.location_name,
-                "is_historical": d.weather.is_historical,
-                "is_estimated": d.weather.is_estimated,
-                "weather": {
-                    "condition": d.weather.condition,
-                    "condition_code": d.weather.condition_code,
-                    "temp_c": d.weather.temp_c,
-                    "feelslike_c": d.weather.feelslike_c,
-                    "wind_kph": d.weather.wind_kph,
-                    "gust_kph": d.weather.gust_kph,
-                    "precip_mm": d.weather.precip_mm,
-                    "snow_cm": d.weather.snow_cm,
-                    "vis_km": d.weather.vis_km,
-                    "humidity": d.weather.humidity,
-                },
-                "risk_score": d.risk.overall_score,
-                "risk_level": d.risk.overall_level,
-                "key_concern": d.risk.primary_concerns[0] if d.risk.primary_concerns else "No significant risk",
-            }
-            for d in day_results
-        ],
+        "primary_concerns": top_concerns,
+        "recommended_actions": top_actions,
+        "daily_timeline": daily_timeline,
     }
 
-    # Serialize day_results for state transport
-    day_results_dicts = [d.model_dump() for d in day_results]
-
     logger.info(
         "[WeatherGraph] Timeline built: %d days, exposure_score=%.1f, high_risk_days=%d",
-        len(day_results), exposure_score, len(high_risk_days),
+        len(day_results), exposure_score, len(high_risk_dates),
     )
-    await _broadcast_progress(
+    _broadcast_progress(
         "timeline_built",
         f"Weather timeline: {len(day_results)} days analyzed, exposure score {exposure_score:.0f}/100",
         {
             "transit_days": transit_days,
             "exposure_score": exposure_score,
-            "high_risk_days": len(high_risk_days),
+            "high_risk_days": len(high_risk_dates),
         },
-        oem_name=state.get("oem_name"), supplier_name=state.get("supplier_name"),
+        oem_name=oem_name, supplier_name=supplier_name,
     )
 
     return {
         "day_results": day_results_dicts,
+        "day_snapshots": day_results,
         "exposure_payload": exposure_payload,
     }
 
@@ -909,6 +1241,17 @@ async def _build_daily_timeline_node(state: WeatherState) -> WeatherState:
 # Node 4: Build risk/opportunity dicts from exposure data
 # ---------------------------------------------------------------------------
 
+# Shipment exposure score -> level.  Higher bands than the per-day risk
+# engine so that moderate weather along a route does not inflate overall
+# supplier risk; bisect_right makes each bound inclusive (>= 35 is moderate).
+_EXPOSURE_LEVEL_BOUNDS = (35.0, 60.0, 80.0)
+_EXPOSURE_LEVELS = (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+
+def _exposure_level(score: float) -> RiskLevel:
+    return _EXPOSURE_LEVELS[bisect_right(_EXPOSURE_LEVEL_BOUNDS, score)]
+
+
 async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
     """
     Convert the exposure payload into structured risk and opportunity dicts
@@ -925,6 +1268,7 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
     oem_city = state.get("oem_city", "Unknown")
     oem_name = state.get("oem_name")
     supplier_name = state.get("supplier_name")
+    transit_days = state.get("transit_days", 0)
 
     exposure_score = summary.get("overall_exposure_score", 0)
     peak_score = summary.get("peak_risk_score", 0)
@@ -937,16 +1281,7 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
     risks: list[dict] = []
     opportunities: list[dict] = []
 
-    # Determine severity from exposure score — use higher thresholds so that
-    # moderate weather along a route does not inflate overall supplier risk.
-    if exposure_score >= 80:
-        severity = "critical"
-    elif exposure_score >= 60:
-        severity = "high"
-    elif exposure_score >= 35:
-        severity = "moderate"
-    else:
-        severity = "low"
+    severity = _exposure_level(exposure_score).value
 
     # Identify the dominant risk factor for precise descriptions
     factor_max = payload.get("risk_factors_max") or {}
@@ -1013,10 +1348,7 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
         # with many moderate weather entries that don't directly disrupt the supplier.
         for day_entry in (payload.get("daily_timeline") or []):
             day_score = day_entry.get("risk_score", 0)
-            day_level = day_entry.get("risk_level", "low")
-            if isinstance(day_level, RiskLevel):
-                day_level = day_level.value
-            if day_level == "critical":
+            if day_entry.get("risk_level", "low") == "critical":
                 w = day_entry.get("weather", {})
                 day_sev = "critical" if day_score >= 75 else "high"
 
@@ -1068,8 +1400,15 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
     else:
         # Favorable conditions — provide actionable opportunity
         timeline = payload.get("daily_timeline") or []
-        avg_temp = sum(d["weather"]["temp_c"] for d in timeline) / len(timeline) if timeline else 0
-        max_wind = max((d["weather"]["wind_kph"] for d in timeline), default=0) if timeline else 0
+        total_temp = 0.0
+        max_wind = 0.0
+        for d in timeline:
+            wx = d["weather"]
+            total_temp += wx["temp_c"]
+            wind_kph = wx["wind_kph"]
+            if wind_kph > max_wind:
+                max_wind = wind_kph
+        avg_temp = total_temp / len(timeline) if timeline else 0
 
         opportunities.append({
             "title": f"Favorable weather: {supplier_city} → {oem_city} route clear",
@@ -1077,7 +1416,7 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
                 f"Weather conditions along the {supplier_city} → {oem_city} "
                 f"transit route are stable with exposure score {exposure_score:.0f}/100. "
                 f"Average temperature {avg_temp:.1f}°C, max wind {max_wind:.0f} km/h. "
-                f"No high-risk days identified across the {state.get('transit_days', 0)}-day transit window."
+                f"No high-risk days identified across the {transit_days}-day transit window."
             ),
             "type": "time_saving",
             "affectedRegion": f"{supplier_city} - {oem_city}",
@@ -1101,7 +1440,7 @@ async def _build_exposure_risks_node(state: WeatherState) -> WeatherState:
         "[WeatherGraph] Exposure risks built: risks=%d opportunities=%d",
         len(risks), len(opportunities),
     )
-    await _broadcast_progress(
+    _broadcast_progress(
         "exposure_risks_built",
         f"Weather analysis: {len(risks)} risks, {len(opportunities)} opportunities",
         {"risks": len(risks), "opportunities": len(opportunities)},
@@ -1175,6 +1514,111 @@ _SUMMARY_PROMPT = ChatPromptTemplate.from_messages([
         ),
     ),
 ])
+# The system prompt has no variables, so it is a fixed prefix of every summary
+# call; for Anthropic it is sent with a cache_control marker (see
+# _LEGACY_SYSTEM_MESSAGES).
+_SUMMARY_SYSTEM_CACHED = SystemMessage(content=[{
+    "type": "text",
+    "text": _SUMMARY_PROMPT.messages[0].format().content,
+    "cache_control": {"type": "ephemeral"},
+}])
+
+
+def _content_text(content: Any) -> str:
+    """Flatten LangChain message content (plain string or list of blocks) into text."""
+    if isinstance(content, str):
+        return content
+    return "".join([
+        str(block.get("text") or "") if isinstance(block, dict) and "text" in block else str(block)
+        for block in content
+    ])
+
+
+# payload hash -> (expiry_ts, summary).  Identical routes/dates re-run within the
+# TTL (UI refreshes, periodic recomputation) reuse the summary instead of
+# paying for another LLM call.
+SUMMARY_CACHE_TTL_SECONDS = 3600
+SUMMARY_CACHE_MAX_ENTRIES = 512
+# Minimum gap between llm_summary_chunk broadcasts; deltas arriving in
+# between are sent together.
+SUMMARY_STREAM_INTERVAL_SECONDS = 0.3
+_summary_cache: dict[str, tuple[float, str]] = {}
+
+
+# In-flight LLM log writes; a reference is held until each one finishes.
+_llm_log_tasks: set[asyncio.Task] = set()
+
+
+def _persist_llm_log_later(*args: Any) -> None:
+    """Write an LLM log row in a worker thread without blocking the caller."""
+    task = asyncio.create_task(asyncio.to_thread(_persist_llm_log, *args))
+    _llm_log_tasks.add(task)
+    task.add_done_callback(_llm_log_tasks.discard)
+
+
+def _summary_cache_key(
+    supplier_city: str, oem_city: str, transit_days: int, start_date: str,
+    exposure_data: dict,
+) -> str:
+    """Hash every input of the summary prompt into a stable cache key."""
+    return _stable_hash({
+        "supplier_city": supplier_city,
+        "oem_city": oem_city,
+        "transit_days": transit_days,
+        "start_date": start_date,
+        "exposure": exposure_data,
+    })
+
+
+# Below this exposure score (with no high/critical days) the summary is templated.
+LOW_EXPOSURE_SUMMARY_THRESHOLD = 25
+
+
+def _low_exposure_summary(
+    supplier_city: str, oem_city: str, transit_days: int, start_date: str, payload: dict,
+) -> str:
+    """Deterministic executive summary for routes with favorable weather."""
+    summary = payload.get("exposure_summary") or {}
+    parts = [
+        f"Weather exposure on the {supplier_city} → {oem_city} route is "
+        f"{summary.get('overall_exposure_score', 0):.0f}/100 (low risk) across "
+        f"{transit_days} days starting {start_date}.",
+    ]
+    peak_day = summary.get("peak_risk_day")
+    if peak_day is not None:
+        parts.append(
+            f"Peak risk is {summary.get('peak_risk_score', 0):.0f}/100 on Day {peak_day} "
+            f"({summary.get('peak_risk_date')}) with no high or critical risk days."
+        )
+    estimated = sum(1 for d in payload.get("daily_timeline") or [] if d.get("is_estimated"))
+    if estimated:
+        parts.append(
+            f"{estimated} day(s) use projected data beyond the 14-day forecast window "
+            "and carry lower confidence."
+        )
+    parts.append("No mitigations are needed; conditions favor expedited shipping.")
+    return " ".join(parts)
+
+
+def _timeline_brief(d: dict) -> dict:
+    """Compact per-day view of a daily_timeline row for the summary prompt.
+
+    Rows come from ``_timeline_row`` so every key is present; index directly.
+    """
+    w = d["weather"]
+    return {
+        "day": d["day"], "date": d["date"], "location": d["location"],
+        "condition": w["condition"],
+        "temp_c": w["temp_c"], "wind_kph": w["wind_kph"],
+        "precip_mm": w["precip_mm"],
+        "snow_cm": w["snow_cm"],
+        "vis_km": w["vis_km"],
+        "humidity": w["humidity"],
+        "risk_score": d["risk_score"], "risk_level": d["risk_level"],
+        "key_concern": d["key_concern"],
+        "is_estimated": d["is_estimated"],
+        "is_historical": d["is_historical"],
+    }
 
 
 async def _llm_summary_node(state: WeatherState) -> WeatherState:
@@ -1187,32 +1631,41 @@ async def _llm_summary_node(state: WeatherState) -> WeatherState:
     oem_name = state.get("oem_name")
     supplier_name = state.get("supplier_name")
 
-    import json
+    # Benign routes get a deterministic summary — the prompt's own rules
+    # mandate a "favorable, no mitigations needed" briefing for them anyway.
+    exposure_summary = payload.get("exposure_summary") or {}
+    if (
+        payload.get("daily_timeline")
+        and exposure_summary.get("overall_exposure_score", 0) < LOW_EXPOSURE_SUMMARY_THRESHOLD
+        and exposure_summary.get("high_risk_day_count", 0) == 0
+        and not settings.weather_llm_summary_low_exposure
+    ):
+        summary = _low_exposure_summary(supplier_city, oem_city, transit_days, start_date, payload)
+        logger.info("[WeatherGraph] Low exposure route — using templated summary (LLM skipped)")
+        return {"agent_summary": summary}
+
     # Include daily timeline + risk factors so LLM can reference specific days accurately
-    timeline_brief = [
-        {
-            "day": d["day"], "date": d["date"], "location": d["location"],
-            "condition": d["weather"]["condition"],
-            "temp_c": d["weather"]["temp_c"], "wind_kph": d["weather"]["wind_kph"],
-            "precip_mm": d["weather"]["precip_mm"],
-            "snow_cm": d["weather"].get("snow_cm", 0),
-            "vis_km": d["weather"].get("vis_km", 10),
-            "humidity": d["weather"].get("humidity", 50),
-            "risk_score": d["risk_score"], "risk_level": d["risk_level"],
-            "key_concern": d.get("key_concern", ""),
-            "is_estimated": d.get("is_estimated", False),
-            "is_historical": d.get("is_historical", False),
-        }
-        for d in (payload.get("daily_timeline") or [])
-    ]
+    timeline_brief = [_timeline_brief(d) for d in (payload.get("daily_timeline") or [])]
     exposure_data = {
-        **(payload.get("exposure_summary") or {}),
+        **exposure_summary,
         "risk_factors_max": payload.get("risk_factors_max", {}),
         "primary_concerns": (payload.get("primary_concerns") or [])[:4],
         "recommended_actions": (payload.get("recommended_actions") or [])[:4],
         "daily_timeline": timeline_brief,
     }
-    exposure_json = json.dumps(exposure_data, indent=2)
+    exposure_json = _dumps_indented(exposure_data)
+
+    cache_key = _summary_cache_key(supplier_city, oem_city, transit_days, start_date, exposure_data)
+    cached_summary = _ttl_cache_get(_summary_cache, cache_key)
+    if cached_summary is not None:
+        logger.info("[WeatherGraph] LLM summary cache hit key=%s", cache_key)
+        _broadcast_progress(
+            "llm_summary_cache_hit",
+            "Weather risk summary reused from cache",
+            {"cache_key": cache_key},
+            oem_name=oem_name, supplier_name=supplier_name,
+        )
+        return {"agent_summary": cached_summary}
 
     llm = get_chat_model()
     if not llm:
@@ -1222,75 +1675,95 @@ async def _llm_summary_node(state: WeatherState) -> WeatherState:
     provider = getattr(llm, "model_provider", None) or type(llm).__name__
     model_name = getattr(llm, "model_name", None) or getattr(llm, "model", "unknown")
     call_id = _uuid.uuid4().hex[:8]
-    start = time.perf_counter()
+    start = _perf()
 
-    prompt_text = _SUMMARY_PROMPT.format(
+    # Render the prompt once: the messages go straight to the model and the
+    # logged text is derived from them.
+    messages = _SUMMARY_PROMPT.format_messages(
         supplier_city=supplier_city, oem_city=oem_city,
         transit_days=transit_days, start_date=start_date,
         exposure_json=exposure_json,
     )
+    prompt_text = get_buffer_string(messages)
+    if _supports_prompt_caching(llm):
+        messages[0] = _SUMMARY_SYSTEM_CACHED
 
     try:
-        await _broadcast_progress(
+        _broadcast_progress(
             "llm_summary_start",
             f"Generating weather risk summary",
             {"provider": provider, "model": str(model_name)},
             oem_name=oem_name, supplier_name=supplier_name,
         )
 
-        chain = _SUMMARY_PROMPT | llm
-        msg = await chain.ainvoke({
-            "supplier_city": supplier_city,
-            "oem_city": oem_city,
-            "transit_days": str(transit_days),
-            "start_date": start_date,
-            "exposure_json": exposure_json,
-        })
+        # Stream the summary so the UI receives text as soon as the first
+        # tokens arrive instead of waiting for the full completion.  Deltas
+        # are coalesced so at most one chunk event goes out per interval.
+        parts: list[str] = []
+        unsent = 0  # trailing entries of parts not yet broadcast
+        last_sent = start
+
+        def _send_unsent() -> None:
+            _broadcast_progress(
+                "llm_summary_chunk",
+                "Weather risk summary streaming",
+                {"delta": "".join(parts[-unsent:]), "partial_len": sum(map(len, parts))},
+                oem_name=oem_name, supplier_name=supplier_name,
+            )
 
-        elapsed = int((time.perf_counter() - start) * 1000)
-        content = msg.content
-        if isinstance(content, str):
-            raw_text = content
-        else:
-            parts: list[str] = []
-            for block in content:
-                if isinstance(block, dict) and "text" in block:
-                    parts.append(str(block.get("text") or ""))
-                else:
-                    parts.append(str(block))
-            raw_text = "".join(parts)
+        async for chunk in llm.astream(messages):
+            delta = _content_text(chunk.content)
+            if not delta:
+                continue
+            parts.append(delta)
+            unsent += 1
+            now = _perf()
+            if now - last_sent >= SUMMARY_STREAM_INTERVAL_SECONDS:
+                _send_unsent()
+                unsent = 0
+                last_sent = now
+        if unsent:
+            _send_unsent()
+
+        elapsed = int((_perf() - start) * 1000)
+        raw_text = "".join(parts)
 
         logger.info(
             "[WeatherGraph] LLM summary id=%s provider=%s elapsed_ms=%d len=%d",
             call_id, provider, elapsed, len(raw_text),
         )
-        _persist_llm_log(
-            call_id, provider, str(model_name),
-            prompt_text, raw_text, "success", elapsed, None,
-        )
-
         summary = raw_text.strip() or None
+        if summary:
+            _ttl_cache_put(
+                _summary_cache, cache_key, summary,
+                SUMMARY_CACHE_TTL_SECONDS, SUMMARY_CACHE_MAX_ENTRIES,
+            )
 
-        await _broadcast_progress(
+        _broadcast_progress(
             "llm_summary_done",
             "Weather risk summary generated",
             {"elapsed_ms": elapsed},
             oem_name=oem_name, supplier_name=supplier_name,
         )
+        # The log row is written in the background; the summary is returned now.
+        _persist_llm_log_later(
+            call_id, provider, str(model_name),
+            prompt_text, raw_text, "success", elapsed, None,
+        )
 
         return {"agent_summary": summary}
 
     except Exception as exc:
-        elapsed = int((time.perf_counter() - start) * 1000)
+        elapsed = int((_perf() - start) * 1000)
         logger.exception("[WeatherGraph] LLM summary error: %s", exc)
-        _persist_llm_log(
-            call_id, provider, str(model_name),
-            prompt_text, None, "error", elapsed, str(exc),
-        )
-        await _broadcast_progress(
+        _broadcast_progress(
             "llm_summary_error", f"LLM summary failed: {exc}",
             oem_name=oem_name, supplier_name=supplier_name,
         )
+        _persist_llm_log_later(
+            call_id, provider, str(model_name),
+            prompt_text, None, "error", elapsed, str(exc),
+        )
         return {"agent_summary": None}
 
 
@@ -1300,17 +1773,27 @@ async def _llm_summary_node(state: WeatherState) -> WeatherState:
 
 _builder = StateGraph(WeatherState)
 
+_builder.add_node("lookup_oem", _lookup_oem_node)
+_builder.add_node("lookup_supplier", _lookup_supplier_node)
+_builder.add_node("fetch_tracking", _fetch_tracking_node)
 _builder.add_node("resolve_cities", _resolve_cities_node)
 _builder.add_node("fetch_forecasts", _fetch_forecasts_node)
 _builder.add_node("build_daily_timeline", _build_daily_timeline_node)
 _builder.add_node("build_exposure_risks", _build_exposure_risks_node)
 _builder.add_node("llm_summary", _llm_summary_node)
 
-_builder.set_entry_point("resolve_cities")
+# Fork: the OEM and supplier DB lookups and the tracking API call are
+# independent; resolve_cities runs once all three have finished.
+_RESOLVE_LEGS = ["lookup_oem", "lookup_supplier", "fetch_tracking"]
+for _leg in _RESOLVE_LEGS:
+    _builder.add_edge(START, _leg)
+_builder.add_edge(_RESOLVE_LEGS, "resolve_cities")
 _builder.add_edge("resolve_cities", "fetch_forecasts")
 _builder.add_edge("fetch_forecasts", "build_daily_timeline")
+# Fan out: both nodes depend only on exposure_payload and write disjoint keys.
 _builder.add_edge("build_daily_timeline", "build_exposure_risks")
-_builder.add_edge("build_exposure_risks", "llm_summary")
+_builder.add_edge("build_daily_timeline", "llm_summary")
+_builder.add_edge("build_exposure_risks", END)
 _builder.add_edge("llm_summary", END)
 
 WEATHER_GRAPH = _builder.compile()
@@ -1320,9 +1803,15 @@ WEATHER_GRAPH = _builder.compile()
 # Public entrypoint
 # ---------------------------------------------------------------------------
 
-async def run_weather_graph(
-    scope: OemScope,
-) -> dict[str, list[dict]]:
+def _new_http_client() -> httpx.AsyncClient:
+    """Pooled client for one graph run, so tracking and WeatherAPI calls reuse connections."""
+    return httpx.AsyncClient(
+        timeout=15.0,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+
+
+async def run_weather_graph(scope: OemScope) -> dict[str, list[dict]]:
     """
     Orchestrate the Weather Exposure Agent using LangGraph.
 
@@ -1337,18 +1826,19 @@ async def run_weather_graph(
     entity_label = f"{oem_label}/{supplier_label}"
 
     logger.info("[WeatherGraph] Starting for %s", entity_label)
-    await _broadcast_progress(
+    _broadcast_progress(
         "started",
         f"Starting weather analysis for {entity_label}",
         {"oem": oem_label, "supplier": supplier_label},
         oem_name=oem_label, supplier_name=supplier_label,
     )
 
-    initial_state: WeatherState = {
-        "scope": scope,
-    }
-
-    final_state = await WEATHER_GRAPH.ainvoke(initial_state)
+    async with _new_http_client() as http_client:
+        initial_state: WeatherState = {
+            "scope": scope,
+            "http_client": http_client,
+        }
+        final_state = await WEATHER_GRAPH.ainvoke(initial_state)
 
     risks = final_state.get("weather_risks") or []
     opps = final_state.get("weather_opportunities") or []
@@ -1360,12 +1850,13 @@ async def run_weather_graph(
         "[WeatherGraph] Completed: oem=%r supplier=%r risks=%d opportunities=%d daily_days=%d",
         oem_resolved, supplier_resolved, len(risks), len(opps), len(daily_timeline),
     )
-    await _broadcast_progress(
+    _broadcast_progress(
         "agent_done",
         f"Weather analysis complete: {len(risks)} risks, {len(opps)} opportunities, {len(daily_timeline)} days",
         {"risks": len(risks), "opportunities": len(opps), "daily_days": len(daily_timeline)},
         oem_name=oem_resolved, supplier_name=supplier_resolved,
     )
+    await _flush_progress()
 
     return {
         "risks": risks,
@@ -1410,29 +1901,25 @@ async def run_weather_agent(
         "supplierName": "",
     }
 
-    initial_state: WeatherState = {
-        "scope": scope,
-        "transit_days": transit_days,
-        "shipment_start_date": shipment_start_date,
-    }
-
-    final_state = await WEATHER_GRAPH.ainvoke(initial_state)
+    async with _new_http_client() as http_client:
+        initial_state: WeatherState = {
+            "scope": scope,
+            "transit_days": transit_days,
+            "shipment_start_date": shipment_start_date,
+            "http_client": http_client,
+        }
+        final_state = await WEATHER_GRAPH.ainvoke(initial_state)
+    await _flush_progress()
 
-    day_dicts = final_state.get("day_results") or []
-    days = [DayRiskSnapshot(**d) for d in day_dicts]
+    # The timeline node already built validated snapshots; reuse them rather
+    # than re-validating their serialised dicts.
+    days = final_state.get("day_snapshots") or []
     payload = final_state.get("exposure_payload") or {}
     summary_data = payload.get("exposure_summary") or {}
 
     exposure_score = summary_data.get("overall_exposure_score", 0.0)
 
-    if exposure_score >= 80:
-        overall_level = RiskLevel.CRITICAL
-    elif exposure_score >= 60:
-        overall_level = RiskLevel.HIGH
-    elif exposure_score >= 35:
-        overall_level = RiskLevel.MODERATE
-    else:
-        overall_level = RiskLevel.LOW
+    overall_level = _exposure_level(exposure_score)
 
     return ShipmentWeatherExposureResponse(
         supplier_city=supplier_city,
@@ -1451,10 +1938,6 @@ async def run_weather_agent(
 # Backward-compat: run_weather_agent_graph (used by v1 supplier_risk_graph)
 # ---------------------------------------------------------------------------
 
-import json as _json
-
-from app.services.agent_orchestrator import _extract_json
-
 
 class _LegacyWeatherItem(TypedDict):
     city: str
@@ -1475,140 +1958,563 @@ class _LegacyWeatherState(TypedDict, total=False):
     weather_opportunities: list[dict]
 
 
+_LEGACY_ITEM_KEYS = (
+    "city", "country", "temperature", "condition",
+    "description", "humidity", "windSpeed", "visibility",
+)
+# Producer rows (app.data.weather) carry every key, so one C-level
+# itemgetter call replaces eight ``dict.get`` lookups per row; rows missing a
+# key fall back to merging onto the all-None template.
+_LEGACY_ITEM_BLANK = dict.fromkeys(_LEGACY_ITEM_KEYS)
+_legacy_item_values = itemgetter(*_LEGACY_ITEM_KEYS)
+
+
 def _build_legacy_weather_items(state: _LegacyWeatherState) -> _LegacyWeatherState:
     raw = state.get("weather_data") or {}
     items = raw.get("weather") or []
+    rows = [item.get("data") if isinstance(item, dict) else item for item in items]
+    blank = _LEGACY_ITEM_BLANK
+    values = _legacy_item_values
+    intern = sys.intern
     normalized: list[_LegacyWeatherItem] = []
-    for item in items:
-        data = item.get("data") if isinstance(item, dict) else item
+    append = normalized.append
+    for data in rows:
         if not isinstance(data, dict):
             continue
-        normalized.append({
-            "city": str(data.get("city") or ""),
-            "country": str(data.get("country") or ""),
-            "temperature": data.get("temperature"),
-            "condition": str(data.get("condition") or ""),
-            "description": str(data.get("description") or ""),
-            "humidity": data.get("humidity"),
-            "windSpeed": data.get("windSpeed"),
-            "visibility": data.get("visibility"),
+        try:
+            row = values(data)
+        except KeyError:
+            row = values({**blank, **data})
+        city, country, temperature, condition, description, humidity, wind, visibility = row
+        append({
+            "city": intern(str(city or "")),
+            "country": intern(str(country or "")),
+            "temperature": temperature,
+            "condition": intern(str(condition or "")),
+            "description": str(description or ""),
+            "humidity": humidity,
+            "windSpeed": wind,
+            "visibility": visibility,
         })
     return {"weather_items": normalized}
 
 
-_legacy_prompt: ChatPromptTemplate | None = None
+_LEGACY_SYSTEM_PROMPT = (
+    "You are a production supply chain weather risk analyst. You receive "
+    "real-time weather observations for cities on a shipment route and produce "
+    "ONLY risks and opportunities that are directly and objectively supported "
+    "by the measured data. This output drives automated operational decisions "
+    "— accuracy is critical.\n\n"
+    "RISK CLASSIFICATION THRESHOLDS (use these exactly):\n"
+    "- Wind: >30 km/h = low risk, >50 km/h = high risk, >80 km/h = critical\n"
+    "- Precipitation: >2 mm = low risk, >10 mm = high risk, >25 mm = critical\n"
+    "- Temperature: >35°C or <-5°C = moderate risk, >40°C or <-15°C = high/critical\n"
+    "- Visibility: <5 km = low risk, <2 km = high risk, <1 km = critical\n"
+    "- Humidity >90% with temp >25°C = moderate heat-stress risk\n"
+    "- Storms/thunderstorms in condition text = high risk minimum\n"
+    "- Snow/ice/blizzard in condition text = high risk minimum for road freight\n\n"
+    "ACCURACY RULES:\n"
+    "1. Only flag a risk when measured values EXCEED the thresholds above. "
+    "Normal weather (clear skies, moderate temp, light breeze) is NOT a risk.\n"
+    "2. For mild/favorable weather, produce an opportunity — do NOT invent risks.\n"
+    "3. Severity MUST match the threshold bands above — never inflate or deflate.\n"
+    "4. Descriptions MUST quote the exact measured values from the data "
+    "(e.g., 'wind at 62 km/h', 'temperature 42°C', 'visibility 0.8 km').\n"
+    "5. estimatedCost and estimatedValue must always be null — never guess "
+    "monetary values without actual cost data.\n"
+    "6. estimatedImpact must describe the specific operational consequence "
+    "(e.g., 'road freight delays of 4-8 hours', 'port crane operations suspended', "
+    "'outdoor loading halted') — not vague language like 'may cause issues'.\n"
+    "7. affectedSupplier should be null unless you can identify it from context.\n"
+    "8. Return ONLY valid JSON. No markdown, no explanation, no code fences, "
+    "no text before or after the JSON object."
+)
+
+_LEGACY_USER_PROMPT = (
+    "Analyze the weather data below for supply chain risks and opportunities.\n\n"
+    "WEATHER DATA BY CITY:\n{weather_items_json}\n\n"
+    "INSTRUCTIONS:\n"
+    "- For each city with adverse conditions exceeding the thresholds, create one risk entry.\n"
+    "- For each city with calm/favorable conditions, create one opportunity entry.\n"
+    "- Cities with unremarkable, average weather get NO entry (skip them).\n"
+    "- If ALL cities have normal weather, return empty risks array and one "
+    "combined opportunity.\n\n"
+    "Return ONLY this JSON structure:\n"
+    '{{"risks": [{{"title": "<city>: <specific condition e.g. Heavy rain warning>", '
+    '"description": "<Must quote exact values: temperature Xc, wind Y km/h, '
+    'precipitation Z mm, visibility W km, condition: text>", '
+    '"severity": "low"|"moderate"|"high"|"critical", '
+    '"affectedRegion": "<city, country>", '
+    '"affectedSupplier": null, '
+    '"estimatedImpact": "<specific operational impact with estimated delay/disruption>", '
+    '"estimatedCost": null}}], '
+    '"opportunities": [{{"title": "<city>: <favorable condition>", '
+    '"description": "<cite actual favorable values from data>", '
+    '"type": "cost_saving"|"time_saving"|"quality_improvement"|'
+    '"market_expansion"|"supplier_diversification", '
+    '"affectedRegion": "<city, country>", '
+    '"potentialBenefit": "<specific benefit: e.g. clear window for expedited shipping>", '
+    '"estimatedValue": null}}]}}'
+)
+
+
+def _split_prompt(template: str, field: str) -> tuple[str, str]:
+    """Pre-render *template* around its single ``{field}`` slot into (head, tail)."""
+    head, tail = template.format(**{field: "\0"}).split("\0")
+    return head, tail
+
+
+# Prompts are rendered once at import; per call only the JSON payload is
+# concatenated in, skipping template parsing and escaping entirely.
+_LEGACY_USER_PARTS: tuple[str, str] = _split_prompt(_LEGACY_USER_PROMPT, "weather_items_json")
+# Keyed by Anthropic cache_control enabled.  The static system prompt is a
+# fixed prefix shared by every call; mark it cacheable so the provider can
+# skip re-processing it (Anthropic ignores the marker below its minimum
+# cacheable length).
+_LEGACY_SYSTEM_MESSAGES: dict[bool, SystemMessage] = {
+    False: SystemMessage(content=_LEGACY_SYSTEM_PROMPT),
+    True: SystemMessage(content=[{
+        "type": "text",
+        "text": _LEGACY_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }]),
+}
+# (llm, runnable, structured) for the most recent model instance, so the
+# structured-output binding is reused while get_chat_model() hands back the
+# same model.
+_legacy_runnable: tuple[Any, Any, bool] | None = None
+
 
+def _supports_prompt_caching(llm: Any) -> bool:
+    """Only Anthropic needs explicit cache_control; OpenAI caches long prefixes automatically."""
+    return type(llm).__name__ == "ChatAnthropic"
 
-def _get_legacy_chain():
-    global _legacy_prompt
+
+def _render_legacy_messages(prompt_caching: bool, payload_json: str) -> list:
+    head, tail = _LEGACY_USER_PARTS
+    return [_LEGACY_SYSTEM_MESSAGES[prompt_caching], HumanMessage(content=head + payload_json + tail)]
+
+
+def _get_legacy_llm() -> tuple[Any, bool, bool] | None:
+    """
+    Return ``(runnable, structured, prompt_caching)`` for the legacy prompt.
+    ``structured`` is True when the model emits schema-validated output
+    (tool calling / JSON schema); otherwise the runnable yields raw text.
+    """
+    global _legacy_runnable
     llm = get_chat_model()
     if llm is None:
         return None
-    if _legacy_prompt is None:
-        _legacy_prompt = ChatPromptTemplate.from_messages([
-            (
-                "system",
-                (
-                    "You are a production supply chain weather risk analyst. You receive "
-                    "real-time weather observations for cities on a shipment route and produce "
-                    "ONLY risks and opportunities that are directly and objectively supported "
-                    "by the measured data. This output drives automated operational decisions "
-                    "— accuracy is critical.\n\n"
-                    "RISK CLASSIFICATION THRESHOLDS (use these exactly):\n"
-                    "- Wind: >30 km/h = low risk, >50 km/h = high risk, >80 km/h = critical\n"
-                    "- Precipitation: >2 mm = low risk, >10 mm = high risk, >25 mm = critical\n"
-                    "- Temperature: >35°C or <-5°C = moderate risk, >40°C or <-15°C = high/critical\n"
-                    "- Visibility: <5 km = low risk, <2 km = high risk, <1 km = critical\n"
-                    "- Humidity >90% with temp >25°C = moderate heat-stress risk\n"
-                    "- Storms/thunderstorms in condition text = high risk minimum\n"
-                    "- Snow/ice/blizzard in condition text = high risk minimum for road freight\n\n"
-                    "ACCURACY RULES:\n"
-                    "1. Only flag a risk when measured values EXCEED the thresholds above. "
-                    "Normal weather (clear skies, moderate temp, light breeze) is NOT a risk.\n"
-                    "2. For mild/favorable weather, produce an opportunity — do NOT invent risks.\n"
-                    "3. Severity MUST match the threshold bands above — never inflate or deflate.\n"
-                    "4. Descriptions MUST quote the exact measured values from the data "
-                    "(e.g., 'wind at 62 km/h', 'temperature 42°C', 'visibility 0.8 km').\n"
-                    "5. estimatedCost and estimatedValue must always be null — never guess "
-                    "monetary values without actual cost data.\n"
-                    "6. estimatedImpact must describe the specific operational consequence "
-                    "(e.g., 'road freight delays of 4-8 hours', 'port crane operations suspended', "
-                    "'outdoor loading halted') — not vague language like 'may cause issues'.\n"
-                    "7. affectedSupplier should be null unless you can identify it from context.\n"
-                    "8. Return ONLY valid JSON. No markdown, no explanation, no code fences, "
-                    "no text before or after the JSON object."
-                ),
-            ),
-            (
-                "user",
-                (
-                    "Analyze the weather data below for supply chain risks and opportunities.\n\n"
-                    "WEATHER DATA BY CITY:\n{weather_items_json}\n\n"
-                    "INSTRUCTIONS:\n"
-                    "- For each city with adverse conditions exceeding the thresholds, create one risk entry.\n"
-                    "- For each city with calm/favorable conditions, create one opportunity entry.\n"
-                    "- Cities with unremarkable, average weather get NO entry (skip them).\n"
-                    "- If ALL cities have normal weather, return empty risks array and one "
-                    "combined opportunity.\n\n"
-                    "Return ONLY this JSON structure:\n"
-                    '{{"risks": [{{"title": "<city>: <specific condition e.g. Heavy rain warning>", '
-                    '"description": "<Must quote exact values: temperature Xc, wind Y km/h, '
-                    'precipitation Z mm, visibility W km, condition: text>", '
-                    '"severity": "low"|"moderate"|"high"|"critical", '
-                    '"affectedRegion": "<city, country>", '
-                    '"affectedSupplier": null, '
-                    '"estimatedImpact": "<specific operational impact with estimated delay/disruption>", '
-                    '"estimatedCost": null}}], '
-                    '"opportunities": [{{"title": "<city>: <favorable condition>", '
-                    '"description": "<cite actual favorable values from data>", '
-                    '"type": "cost_saving"|"time_saving"|"quality_improvement"|'
-                    '"market_expansion"|"supplier_diversification", '
-                    '"affectedRegion": "<city, country>", '
-                    '"potentialBenefit": "<specific benefit: e.g. clear window for expedited shipping>", '
-                    '"estimatedValue": null}}]}}'
-                ),
-            ),
-        ])
-    return _legacy_prompt | llm
+    prompt_caching = _supports_prompt_caching(llm)
+    cached = _legacy_runnable
+    if cached is None or cached[0] is not llm:
+        try:
+            runnable = llm.with_structured_output(LegacyWeatherResult)
+            structured = True
+        except NotImplementedError:
+            runnable = llm
+            structured = False
+        cached = _legacy_runnable = (llm, runnable, structured)
+    return cached[1], cached[2], prompt_caching
+
+
+# prompt payload digest -> (expiry_ts, {"weather_risks", "weather_opportunities"}).
+# Only identical payloads share an entry: the model quotes the measured
+# values back, so near-duplicates must not reuse each other's results.  The
+# TTL matches the WeatherAPI response cache, past which readings are stale.
+LEGACY_LLM_CACHE_TTL_SECONDS = 900
+LEGACY_LLM_CACHE_MAX_ENTRIES = 512
+_legacy_llm_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _legacy_items_cache_key(items: list[_LegacyWeatherItem]) -> str:
+    """Digest of the exact rows sent to the LLM for *items*."""
+    return _stable_hash(_legacy_prompt_rows(items))
+
+
+# ---------------------------------------------------------------------------
+# Deterministic classification of legacy weather rows
+# ---------------------------------------------------------------------------
+# The thresholds below are the ones the legacy system prompt asks the LLM to
+# apply.  With settings.weather_rule_classification enabled, rows with usable
+# numerics are classified here directly; only rows whose condition text
+# signals a hazard that the numerics cannot confirm are sent to the LLM.
+#
+# Legacy items come from OpenWeatherMap with metric units: temperature in °C,
+# windSpeed in m/s and visibility in metres.
+
+_STORM_WORDS = ("storm", "thunder", "tornado", "hurricane", "cyclone", "typhoon", "squall")
+_WINTER_WORDS = ("snow", "ice", "icy", "blizzard", "sleet", "freezing", "hail")
+_HAZARD_WORDS = _STORM_WORDS + _WINTER_WORDS + ("fog",)
+# One compiled alternation per word list scans the text once in C instead of
+# one substring test per word.
+_STORM_RE = re.compile("|".join(_STORM_WORDS))
+_WINTER_RE = re.compile("|".join(_WINTER_WORDS))
+_HAZARD_RE = re.compile("|".join(_HAZARD_WORDS))
+
+# The prompt's threshold bands as bisect tables: the band index picks a
+# (rank, severity, title) entry, or None when no threshold is exceeded.
+# Wind/heat bands are upper-exclusive ("> 30"), so they use bisect_left;
+# visibility/cold bands are lower-exclusive ("< 1"), so they use bisect_right.
+_WIND_KPH_BOUNDS = (30, 50, 80)
+_WIND_BANDS = (
+    None,
+    (1, "low", "Strong wind"),
+    (3, "high", "High wind warning"),
+    (4, "critical", "Extreme wind"),
+)
+_HEAT_BOUNDS = (35, 40)
+_HEAT_BANDS = (None, (2, "moderate", "High heat"), (3, "high", "Extreme heat"))
+_COLD_BOUNDS = (-15, -5)
+_COLD_BANDS = ((3, "high", "Extreme cold"), (2, "moderate", "Severe cold"), None)
+_VIS_KM_BOUNDS = (1, 2, 5)
+_VIS_BANDS = (
+    (4, "critical", "Very low visibility"),
+    (3, "high", "Low visibility"),
+    (1, "low", "Reduced visibility"),
+    None,
+)
+_HUMIDITY_BAND = (2, "moderate", "Heat-stress humidity")
+_STORM_BAND = (3, "high", "Thunderstorm warning")
+_WINTER_BAND = (3, "high", "Snow/ice conditions")
+_band_rank = itemgetter(0)
+
+_LEGACY_IMPACTS = {
+    "wind": "Road freight speed restrictions and possible port crane suspensions; expect 4-12 hour handling delays",
+    "temperature": "Outdoor loading and warehouse work slowed by temperature extremes; temperature-sensitive cargo needs protection",
+    "visibility": "Reduced visibility slows road, port and air movements; expect 2-8 hour delays",
+    "humidity": "Heat-stress limits outdoor handling shifts; moisture-sensitive goods need protection",
+    "storm": "Thunderstorms likely to halt outdoor loading and delay port and air operations by 6-24 hours",
+    "winter": "Snow/ice conditions disrupt road freight; expect 12-48 hour delays or route closures",
+}
+
+
+def _as_number(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _measured_values(
+    item: _LegacyWeatherItem,
+    temp: float | None,
+    wind_kph: float | None,
+    vis_km: float | None,
+    humidity: float | None,
+) -> str:
+    values: list[str] = []
+    if temp is not None:
+        values.append(f"temperature {temp:.1f}°C")
+    if wind_kph is not None:
+        values.append(f"wind {wind_kph:.0f} km/h")
+    if vis_km is not None:
+        values.append(f"visibility {vis_km:.1f} km")
+    if humidity is not None:
+        values.append(f"humidity {humidity:.0f}%")
+    condition = item["condition"] or "Unknown"
+    values.append(f"condition: {condition}" + (f" ({item['description']})" if item["description"] else ""))
+    return ", ".join(values)
+
+
+def _classify_row(item: _LegacyWeatherItem) -> tuple[list[dict], list[dict]] | None:
+    """Apply the legacy prompt's risk thresholds to one weather row.
+
+    Returns ``([risk], [])`` for adverse weather, ``([], [opportunity])`` for
+    calm/favorable weather and ``([], [])`` for unremarkable weather.  Returns
+    None for ambiguous rows — the condition text signals a hazard but
+    numerics are missing — which are left to the LLM.
+    """
+    temp = _as_number(item["temperature"])
+    wind_ms = _as_number(item["windSpeed"])
+    vis_m = _as_number(item["visibility"])
+    text = f"{item['condition']} {item['description']}".lower()
+    if (temp is None or wind_ms is None or vis_m is None) and _HAZARD_RE.search(text):
+        return None
+    wind_kph = wind_ms * 3.6 if wind_ms is not None else None
+    vis_km = vis_m / 1000 if vis_m is not None else None
+    humidity = _as_number(item["humidity"])
+
+    # (rank, severity, title, driver) for every threshold that is exceeded
+    triggers: list[tuple[int, str, str, str]] = []
+    if wind_kph is not None and (band := _WIND_BANDS[bisect_left(_WIND_KPH_BOUNDS, wind_kph)]):
+        triggers.append((*band, "wind"))
+    if temp is not None:
+        band = (
+            _HEAT_BANDS[bisect_left(_HEAT_BOUNDS, temp)] if temp > 0
+            else _COLD_BANDS[bisect_right(_COLD_BOUNDS, temp)]
+        )
+        if band:
+            triggers.append((*band, "temperature"))
+    if vis_km is not None and (band := _VIS_BANDS[bisect_right(_VIS_KM_BOUNDS, vis_km)]):
+        triggers.append((*band, "visibility"))
+    if humidity is not None and temp is not None and humidity > 90 and temp > 25:
+        triggers.append((*_HUMIDITY_BAND, "humidity"))
+    if _STORM_RE.search(text):
+        triggers.append((*_STORM_BAND, "storm"))
+    if _WINTER_RE.search(text):
+        triggers.append((*_WINTER_BAND, "winter"))
+
+    if triggers:
+        _, severity, title, driver = max(triggers, key=_band_rank)
+    elif not (
+        temp is not None and 10 <= temp <= 30
+        and wind_kph is not None and wind_kph <= 20
+        and (vis_km is None or vis_km >= 8)
+    ):
+        # Unremarkable weather: no entry, so skip formatting the description.
+        return [], []
+
+    city = item["city"] or "Unknown city"
+    region = ", ".join(p for p in (item["city"], item["country"]) if p) or None
+    measured = _measured_values(item, temp, wind_kph, vis_km, humidity)
+    if triggers:
+        return [{
+            "title": f"{city}: {title}",
+            "description": f"Measured {measured}.",
+            "severity": severity,
+            "affectedRegion": region,
+            "affectedSupplier": None,
+            "estimatedImpact": _LEGACY_IMPACTS[driver],
+            "estimatedCost": None,
+        }], []
+    return [], [{
+        "title": f"{city}: Clear shipping window",
+        "description": f"Favorable conditions measured: {measured}.",
+        "type": "time_saving",
+        "affectedRegion": region,
+        "potentialBenefit": "Clear window for on-time or expedited shipping through this city",
+        "estimatedValue": None,
+    }]
+
+
+# Each shipment is classified in its own LLM call; the semaphore caps
+# in-flight legacy LLM calls per event loop
+# (settings.weather_llm_max_concurrency) so concurrent shipments stay within
+# provider rate limits.
+_legacy_llm_semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _legacy_llm_semaphore() -> asyncio.Semaphore:
+    return loop_scoped(
+        _legacy_llm_semaphores,
+        lambda: asyncio.Semaphore(max(1, settings.weather_llm_max_concurrency)),
+    )
+
+
+# Rate-limit / overload / transient network failures are retried with
+# full-jitter exponential backoff.  The backoff sleep happens outside the
+# semaphore so waiting retries do not hold a concurrency slot.
+LEGACY_LLM_RETRY_ATTEMPTS = 3
+LEGACY_LLM_RETRY_BASE_SECONDS = 1.0
+LEGACY_LLM_RETRY_MAX_SECONDS = 20.0
+_RETRYABLE_LLM_STATUS = frozenset({408, 429, 500, 502, 503, 504, 529})
+_RETRYABLE_LLM_ERRORS = frozenset({
+    "RateLimitError", "APITimeoutError", "APIConnectionError",
+    "InternalServerError", "OverloadedError",
+})
+
+
+def _is_retryable_llm_error(exc: BaseException) -> bool:
+    if isinstance(exc, (TimeoutError, httpx.TransportError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _RETRYABLE_LLM_STATUS or type(exc).__name__ in _RETRYABLE_LLM_ERRORS
+
+
+def _llm_retry_delay(attempt: int) -> float:
+    return random.uniform(0, min(LEGACY_LLM_RETRY_MAX_SECONDS, LEGACY_LLM_RETRY_BASE_SECONDS * 2 ** attempt))
+
+
+def _legacy_parse(parsed: dict) -> tuple[list[dict], list[dict]]:
+    risks = [r for r in (parsed.get("risks") or []) if isinstance(r, dict) and r.get("title") and r.get("description")]
+    opps = [o for o in (parsed.get("opportunities") or []) if isinstance(o, dict) and o.get("title") and o.get("description")]
+    return risks, opps
+
+
+def _legacy_prompt_rows(items: list[_LegacyWeatherItem]) -> list[dict]:
+    """Copies of *items* with float readings cut to one decimal — extra digits only cost tokens."""
+    rows: list[dict] = []
+    for item in items:
+        row = dict(item)
+        for key in ("temperature", "windSpeed"):
+            value = row[key]
+            if isinstance(value, float):
+                row[key] = round(value, 1)
+        rows.append(row)
+    return rows
+
+
+async def _invoke_legacy_llm(
+    items: list[_LegacyWeatherItem],
+) -> tuple[list[dict], list[dict]] | None:
+    """
+    Classify one shipment's *items* in a single LLM call; ``None`` when no
+    usable answer came back.  Models with structured output return validated
+    results directly; for the rest JSON is extracted from the text reply.
+    """
+    try:
+        bound = _get_legacy_llm()
+        if not bound:
+            return None
+        runnable, structured, prompt_caching = bound
+        messages = _render_legacy_messages(
+            prompt_caching, _dumps_compact(_legacy_prompt_rows(items)),
+        )
+        for attempt in range(LEGACY_LLM_RETRY_ATTEMPTS):
+            try:
+                async with _legacy_llm_semaphore():
+                    result = await runnable.ainvoke(messages)
+                break
+            except Exception as exc:
+                if attempt + 1 >= LEGACY_LLM_RETRY_ATTEMPTS or not _is_retryable_llm_error(exc):
+                    raise
+                delay = _llm_retry_delay(attempt)
+                logger.warning(
+                    "Legacy WeatherAgent LLM call failed (%s); retry %d/%d in %.1fs",
+                    type(exc).__name__, attempt + 1, LEGACY_LLM_RETRY_ATTEMPTS - 1, delay,
+                )
+                await asyncio.sleep(delay)
+
+        if structured:
+            if isinstance(result, LegacyWeatherResult):
+                return _legacy_parse(result.model_dump(mode="json"))
+            return None
+        parsed = _extract_json(_content_text(result.content))
+        return _legacy_parse(parsed) if isinstance(parsed, dict) else None
+    except Exception as exc:
+        logger.exception("Legacy WeatherAgent LLM error: %s", exc)
+        return None
+
+
+async def _classify_with_llm(items: list[_LegacyWeatherItem]) -> tuple[list[dict], list[dict]]:
+    """Ask the LLM to classify *items*; results are cached by canonical item digest."""
+    cache_key = _legacy_items_cache_key(items)
+    cached = _ttl_cache_get(_legacy_llm_cache, cache_key)
+    if cached is not None:
+        logger.info("Legacy WeatherAgent cache hit key=%s items=%d", cache_key, len(items))
+        return list(cached["weather_risks"]), list(cached["weather_opportunities"])
+    result = await _invoke_legacy_llm(items)
+    if result is None:
+        return [], []
+    risks, opps = result
+    _ttl_cache_put(
+        _legacy_llm_cache, cache_key,
+        {"weather_risks": risks, "weather_opportunities": opps},
+        LEGACY_LLM_CACHE_TTL_SECONDS, LEGACY_LLM_CACHE_MAX_ENTRIES,
+    )
+    return list(risks), list(opps)
+
+
+def _combined_normal_opportunity(
+    items: list[_LegacyWeatherItem], favorable: list[dict],
+) -> dict:
+    """Single route-wide opportunity for a shipment whose cities all have normal weather."""
+    cities = list(dict.fromkeys(item["city"] for item in items if item["city"]))
+    regions = list(dict.fromkeys(
+        ", ".join(p for p in (item["city"], item["country"]) if p)
+        for item in items if item["city"] or item["country"]
+    ))
+    description = (
+        f"All {len(items)} route weather readings are within normal thresholds"
+        + (f" ({', '.join(cities)})" if cities else "")
+        + "; no wind, temperature, visibility, storm or snow/ice limits exceeded."
+    )
+    if favorable:
+        clear = [o["title"].split(":", 1)[0] for o in favorable]
+        description += f" Clear shipping windows in: {', '.join(dict.fromkeys(clear))}."
+    return {
+        "title": "All route cities: Normal weather conditions",
+        "description": description,
+        "type": "time_saving",
+        "affectedRegion": "; ".join(regions) or None,
+        "potentialBenefit": "Weather poses no constraint on the route; on-time or expedited shipping is feasible",
+        "estimatedValue": None,
+    }
 
 
 async def _legacy_weather_risk_llm(state: _LegacyWeatherState) -> _LegacyWeatherState:
+    """
+    Classify weather rows with the LLM.  When rule classification is enabled,
+    threshold rules handle the clear-cut rows and only ambiguous ones reach
+    the LLM.
+    """
     items = state.get("weather_items") or []
     if not items:
         return {"weather_risks": [], "weather_opportunities": []}
-    chain = _get_legacy_chain()
-    if not chain:
-        return {"weather_risks": [], "weather_opportunities": []}
-    try:
-        items_json = _json.dumps(items, indent=2)
-        msg = await chain.ainvoke({"weather_items_json": items_json})
-        content = msg.content
-        if isinstance(content, str):
-            raw_text = content
-        else:
-            parts: list[str] = []
-            for block in content:
-                if isinstance(block, dict) and "text" in block:
-                    parts.append(str(block.get("text") or ""))
-                else:
-                    parts.append(str(block))
-            raw_text = "".join(parts)
-        parsed = _extract_json(raw_text) or {}
-        risks = [r for r in (parsed.get("risks") or []) if isinstance(r, dict) and r.get("title") and r.get("description")]
-        opps = [o for o in (parsed.get("opportunities") or []) if isinstance(o, dict) and o.get("title") and o.get("description")]
+    if not settings.weather_rule_classification:
+        risks, opps = await _classify_with_llm(items)
         return {"weather_risks": risks, "weather_opportunities": opps}
-    except Exception as exc:
-        logger.exception("Legacy WeatherAgent LLM error: %s", exc)
-        return {"weather_risks": [], "weather_opportunities": []}
+
+    risks: list[dict] = []
+    opps: list[dict] = []
+    ambiguous: list[_LegacyWeatherItem] = []
+    # Readings and condition text are parsed once per row: the ambiguity
+    # check happens inside _classify_row.
+    classify = _classify_row
+    for item in items:
+        classified = classify(item)
+        if classified is None:
+            ambiguous.append(item)
+            continue
+        row_risks, row_opps = classified
+        if row_risks:
+            risks += row_risks
+        elif row_opps:
+            opps += row_opps
+
+    if not risks and not ambiguous:
+        # Prompt rule: when every city has normal weather, return no risks
+        # and one combined opportunity — no LLM call needed.
+        return {"weather_risks": [], "weather_opportunities": [_combined_normal_opportunity(items, opps)]}
+
+    if ambiguous:
+        logger.info(
+            "Legacy WeatherAgent: %d/%d rows ambiguous — sending to LLM",
+            len(ambiguous), len(items),
+        )
+        llm_risks, llm_opps = await _classify_with_llm(ambiguous)
+        risks.extend(llm_risks)
+        opps.extend(llm_opps)
+
+    return {"weather_risks": risks, "weather_opportunities": opps}
+
+
+async def _run_legacy_pipeline(state: _LegacyWeatherState) -> _LegacyWeatherState:
+    """
+    Run the two legacy steps in order: build items, then classify them.
+    Plain calls rather than a compiled graph — the pipeline is linear, so a
+    graph runtime would only add per-step channel bookkeeping.
+    """
+    state = dict(state)
+    state.update(_build_legacy_weather_items(state))
+    state.update(await _legacy_weather_risk_llm(state))
+    return state
+
+
+_LEGACY_RISK_DB_KEYS = (
+    "title", "description", "severity", "affectedRegion",
+    "affectedSupplier", "estimatedImpact", "estimatedCost",
+)
+_LEGACY_OPPORTUNITY_DB_KEYS = (
+    "title", "description", "type", "affectedRegion", "potentialBenefit", "estimatedValue",
+)
+_LEGACY_EXPOSURE_KEYS = ("weather_exposure_score", "storm_risk", "temperature_extreme_days")
+
+
+def _legacy_risk_for_db(r: dict) -> dict:
+    row = {k: r.get(k) for k in _LEGACY_RISK_DB_KEYS}
+    row["sourceType"] = "weather"
+    row["sourceData"] = {"weatherExposure": {k: r.get(k) for k in _LEGACY_EXPOSURE_KEYS}}
+    return row
 
 
-_legacy_builder = StateGraph(_LegacyWeatherState)
-_legacy_builder.add_node("build_items", _build_legacy_weather_items)
-_legacy_builder.add_node("weather_risk_llm", _legacy_weather_risk_llm)
-_legacy_builder.set_entry_point("build_items")
-_legacy_builder.add_edge("build_items", "weather_risk_llm")
-_legacy_builder.add_edge("weather_risk_llm", END)
-_LEGACY_WEATHER_GRAPH = _legacy_builder.compile()
+def _legacy_opportunity_for_db(o: dict) -> dict:
+    row = {k: o.get(k) for k in _LEGACY_OPPORTUNITY_DB_KEYS}
+    row["sourceType"] = "weather"
+    row["sourceData"] = None
+    return row
 
 
 async def run_weather_agent_graph(
@@ -1624,44 +2530,13 @@ async def run_weather_agent_graph(
         "scope": scope,
         "weather_data": weather_data,
     }
-    final_state = await _LEGACY_WEATHER_GRAPH.ainvoke(initial_state)
+    final_state = await _run_legacy_pipeline(initial_state)
 
     risks = final_state.get("weather_risks") or []
     opps = final_state.get("weather_opportunities") or []
 
-    risks_for_db: list[dict] = []
-    opps_for_db: list[dict] = []
-
-    for r in risks:
-        risks_for_db.append({
-            "title": r["title"],
-            "description": r["description"],
-            "severity": r.get("severity"),
-            "affectedRegion": r.get("affectedRegion"),
-            "affectedSupplier": r.get("affectedSupplier"),
-            "estimatedImpact": r.get("estimatedImpact"),
-            "estimatedCost": r.get("estimatedCost"),
-            "sourceType": "weather",
-            "sourceData": {
-                "weatherExposure": {
-                    "weather_exposure_score": r.get("weather_exposure_score"),
-                    "storm_risk": r.get("storm_risk"),
-                    "temperature_extreme_days": r.get("temperature_extreme_days"),
-                }
-            },
-        })
-
-    for o in opps:
-        opps_for_db.append({
-            "title": o["title"],
-            "description": o["description"],
-            "type": o.get("type"),
-            "affectedRegion": o.get("affectedRegion"),
-            "potentialBenefit": o.get("potentialBenefit"),
-            "estimatedValue": o.get("estimatedValue"),
-            "sourceType": "weather",
-            "sourceData": None,
-        })
+    risks_for_db = [_legacy_risk_for_db(r) for r in risks]
+    opps_for_db = [_legacy_opportunity_for_db(o) for o in opps]
 
     return {
         "risks": risks_for_db,
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 from typing import Annotated
 from uuid import UUID
@@ -13,6 +14,12 @@ from app.models.oem import Oem
 
 security = HTTPBearer(auto_error=False)
 
+# Verified token payloads: token -> (expiry_ts, payload).  An entry lives
+# until the token's own exp, capped so a rotated secret takes effect quickly.
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_ENTRIES = 4096
+_token_cache: dict[str, tuple[float, dict]] = {}
+
 
 def create_access_token(oem_id: UUID, email: str) -> str:
     expire = datetime.utcnow() + timedelta(days=settings.jwt_expire_days)
@@ -21,37 +28,57 @@ def create_access_token(oem_id: UUID, email: str) -> str:
 
 
 def decode_token(token: str) -> dict:
+    now = time.time()
+    entry = _token_cache.get(token)
+    if entry is not None:
+        if entry[0] > now:
+            return entry[1]
+        _token_cache.pop(token, None)
     try:
         payload = jwt.decode(
             token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
         )
-        return payload
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing token",
         )
+    expiry = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expiry = min(expiry, exp)
+    if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+        # Evict the oldest insertion (dicts preserve insertion order).
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[token] = (expiry, payload)
+    return payload
 
 
-async def get_current_oem(
+async def get_token_payload(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: Annotated[Session, Depends(get_db)],
-) -> Oem:
+) -> dict:
+    """Verified bearer-token payload; raises 401 before any DB session is opened."""
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing token",
         )
     payload = decode_token(credentials.credentials)
-    oem_id = payload.get("sub")
-    if not oem_id:
+    if not payload.get("sub"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing token",
         )
+    return payload
+
+
+async def get_current_oem(
+    payload: Annotated[dict, Depends(get_token_payload)],
+    db: Annotated[Session, Depends(get_db)],
+) -> Oem:
     from app.services.oems import get_oem_by_id
 
-    oem = get_oem_by_id(db, UUID(oem_id))
+    oem = get_oem_by_id(db, UUID(payload["sub"]))
     if not oem:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
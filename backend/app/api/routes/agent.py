@@ -1,3 +1,6 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
@@ -7,8 +10,8 @@ from app.database import get_db
 from app.api.deps import get_current_oem
 from app.models.oem import Oem
 from app.orchestration.agent_service import (
-    get_status,
     get_latest_risk_score,
+    get_status_with_risk_score,
     trigger_manual_analysis_sync,
     trigger_manual_analysis_v2_sync,
     trigger_news_analysis_sync,
@@ -17,6 +20,19 @@ from app.orchestration.agent_service import (
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 
+# Analysis runs take minutes; they get their own threads so they neither hold
+# AnyIO threadpool tokens needed by sync endpoints nor starve asyncio's
+# default executor (asyncio.to_thread DB lookups and LLM log writes).
+ANALYSIS_MAX_WORKERS = 4
+_analysis_executor = ThreadPoolExecutor(
+    max_workers=ANALYSIS_MAX_WORKERS, thread_name_prefix="agent-analysis",
+)
+
+
+async def _run_analysis(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_analysis_executor, functools.partial(fn, *args, **kwargs))
+
 
 class TriggerBody(BaseModel):
     oemId: UUID | None = None
@@ -29,17 +45,11 @@ def agent_status(
     oem: Oem = Depends(get_current_oem),
     oemId: UUID | None = Query(None),
 ):
-    status = get_status(db)
-    if not status:
-        _ensure_agent_status(db)
-        status = get_status(db)
     oid = oemId or oem.id
-    risk_score_ent = get_latest_risk_score(db, oid)
-    risk_score = (
-        float(risk_score_ent.overallScore)
-        if risk_score_ent and risk_score_ent.overallScore is not None
-        else None
-    )
+    status, overall_score = get_status_with_risk_score(db, oid)
+    if not status:
+        status = _ensure_agent_status(db)
+    risk_score = float(overall_score) if overall_score is not None else None
     if not status:
         return {
             "status": "idle",
@@ -88,18 +98,18 @@ def risk_score(
 
 
 @router.post("/trigger")
-def trigger_analysis(
+async def trigger_analysis(
     body: TriggerBody | None = None,
     oem: Oem = Depends(get_current_oem),
     db: Session = Depends(get_db),
 ):
     oem_id = (body.oemId if body else None) or oem.id
-    trigger_manual_analysis_sync(db, oem_id)
+    await _run_analysis(trigger_manual_analysis_sync, db, oem_id)
     return {"message": "Analysis triggered successfully", "oemId": str(oem_id)}
 
 
 @router.post("/trigger/news")
-def trigger_news_analysis(
+async def trigger_news_analysis(
     body: TriggerBody | None = None,
     oem: Oem = Depends(get_current_oem),
     db: Session = Depends(get_db),
@@ -113,7 +123,9 @@ def trigger_news_analysis(
     """
     oem_id = (body.oemId if body else None) or oem.id
     supplier_id = body.supplierId if body else None
-    result = trigger_news_analysis_sync(db, oem_id, supplier_id=supplier_id)
+    result = await _run_analysis(
+        trigger_news_analysis_sync, db, oem_id, supplier_id=supplier_id
+    )
     return {
         "message": "News analysis completed successfully",
         "oemId": str(oem_id),
@@ -123,7 +135,7 @@ def trigger_news_analysis(
 
 
 @router.post("/trigger/v2")
-def trigger_analysis_v2(
+async def trigger_analysis_v2(
     body: TriggerBody | None = None,
     oem: Oem = Depends(get_current_oem),
     db: Session = Depends(get_db),
@@ -138,7 +150,7 @@ def trigger_analysis_v2(
     The original /agent/trigger endpoint is unchanged.
     """
     oem_id = (body.oemId if body else None) or oem.id
-    trigger_manual_analysis_v2_sync(db, oem_id)
+    await _run_analysis(trigger_manual_analysis_v2_sync, db, oem_id)
     return {
         "message": "Graph-based analysis (v2) triggered successfully",
         "oemId": str(oem_id),
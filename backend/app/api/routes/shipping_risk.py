@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models.oem import Oem
 from app.models.supplier import Supplier
 from app.schemas.shipping_risk import BulkShippingRiskResult, ShippingRiskResult
@@ -14,6 +16,10 @@ from app.services.shipping_risk import calculate_shipping_risk
 
 router = APIRouter(prefix="/shipping/shipping-risk", tags=["shipping"])
 
+# Upper bound on suppliers assessed at once by /run-all (each is a tracking
+# fetch plus an LLM call).
+RUN_ALL_CONCURRENCY = 8
+
 
 def _build_scope(supplier: Supplier, oem: Oem | None) -> OemScope:
     """Build OemScope from a Supplier DB row and its OEM."""
@@ -61,8 +67,17 @@ def run_for_supplier(
     return ShippingRiskResult(**result_dict)
 
 
-@router.post("/run-all", response_model=list[BulkShippingRiskResult])
-def run_for_all(db: Session = Depends(get_db)) -> list[BulkShippingRiskResult]:
+def _calculate_in_own_session(scope: OemScope) -> dict:
+    """calculate_shipping_risk for a worker thread: sessions are not thread-safe."""
+    db = SessionLocal()
+    try:
+        return calculate_shipping_risk(scope, db)
+    finally:
+        db.close()
+
+
+def _load_scopes(db: Session) -> list[tuple[str, str, OemScope]]:
+    """(supplier id, supplier name, scope) for every supplier; blocking DB I/O."""
     suppliers = db.query(Supplier).all()
 
     oem_ids = {str(s.oemId) for s in suppliers if s.oemId}
@@ -72,17 +87,33 @@ def run_for_all(db: Session = Depends(get_db)) -> list[BulkShippingRiskResult]:
         else {}
     )
 
-    results: list[BulkShippingRiskResult] = []
-    for supplier in suppliers:
-        oem = oems.get(str(supplier.oemId)) if supplier.oemId else None
-        scope = _build_scope(supplier, oem)
-        result_dict = calculate_shipping_risk(scope, db)
-        results.append(
-            BulkShippingRiskResult(
-                supplier_id=str(supplier.id),
-                supplier_name=supplier.name,
-                result=ShippingRiskResult(**result_dict),
-            )
+    return [
+        (
+            str(supplier.id),
+            supplier.name,
+            _build_scope(supplier, oems.get(str(supplier.oemId)) if supplier.oemId else None),
         )
+        for supplier in suppliers
+    ]
+
 
-    return results
+@router.post("/run-all", response_model=list[BulkShippingRiskResult])
+async def run_for_all(db: Session = Depends(get_db)) -> list[BulkShippingRiskResult]:
+    # Queries run in a worker thread so they don't block the event loop.
+    scopes = await asyncio.to_thread(_load_scopes, db)
+    sem = asyncio.Semaphore(RUN_ALL_CONCURRENCY)
+
+    async def _one(scope: OemScope) -> dict:
+        async with sem:
+            return await asyncio.to_thread(_calculate_in_own_session, scope)
+
+    result_dicts = await asyncio.gather(*(_one(scope) for _, _, scope in scopes))
+
+    return [
+        BulkShippingRiskResult(
+            supplier_id=supplier_id,
+            supplier_name=supplier_name,
+            result=ShippingRiskResult(**result_dict),
+        )
+        for (supplier_id, supplier_name, _), result_dict in zip(scopes, result_dicts)
+    ]
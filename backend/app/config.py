@@ -21,6 +21,15 @@ class Settings(BaseSettings):
 
     weather_api_key: str | None = None
     weather_days_forecast: int = 3
+    # Call the LLM for the weather summary even on low-exposure routes
+    # (normally a deterministic template is used); enable for audit runs.
+    weather_llm_summary_low_exposure: bool = False
+    # Cap on in-flight weather LLM calls per event loop (provider rate limits).
+    weather_llm_max_concurrency: int = 4
+    # Classify legacy weather rows with the prompt's thresholds and only send
+    # ambiguous rows to the LLM.  Rule wording differs from the LLM's and has
+    # no precipitation bands, so it stays opt-in.
+    weather_rule_classification: bool = False
     news_api_key: str | None = None
 
     # Trend insights agent
@@ -5,6 +5,48 @@ from typing import Any
 from app.schemas.weather_agent import RiskFactor, RiskLevel
 
 
+# WeatherAPI.com condition-code tables, built once at import rather than on
+# every scoring call.
+
+# Snow, ice, sleet, freezing conditions.
+# Full set: patchy snow, light snow, moderate snow, heavy snow, ice pellets,
+# blizzard, freezing rain, freezing drizzle, sleet, blowing snow
+_SNOW_ICE_CODES = frozenset({
+    1063, 1066, 1069, 1072,                              # patchy rain/snow/sleet/freezing
+    1114, 1117,                                            # blowing snow, blizzard
+    1147,                                                  # freezing fog
+    1150, 1153, 1168, 1171,                               # drizzle, freezing drizzle
+    1198, 1201,                                            # light/heavy freezing rain
+    1204, 1207,                                            # light/heavy sleet
+    1210, 1213, 1216, 1219, 1222, 1225,                   # snow (light→heavy)
+    1237,                                                  # ice pellets
+    1249, 1252,                                            # light/moderate sleet showers
+    1255, 1258,                                            # light/moderate snow showers
+    1261, 1264,                                            # light/moderate ice pellet showers
+    1279, 1282,                                            # snow/ice with thunder
+})
+
+# Fog codes — not snow/ice but hazardous for transport
+_FOG_CODES = frozenset({1030, 1135, 1147})
+
+# Thunderstorm codes: thunder, patchy rain/snow/ice with thunder
+_STORM_CODES = frozenset({1087, 1273, 1276, 1279, 1282})
+
+# Blizzard and heavy snow also threaten power lines
+_HEAVY_WINTER_CODES = frozenset({1117, 1219, 1222, 1225, 1258})
+
+# Severe conditions that cause port/route closures: heavy rain, freezing rain,
+# sleet, snow, blizzard, ice pellets, thunderstorms with precipitation
+_SEVERE_CLOSURE_CODES = frozenset({
+    1117,                                # blizzard
+    1195, 1198, 1201,                    # heavy rain, light/heavy freezing rain
+    1204, 1207,                          # light/heavy sleet
+    1219, 1222, 1225,                    # moderate/heavy/blizzard snow
+    1237, 1264,                          # ice pellets
+    1273, 1276, 1279, 1282,              # thunderstorm variants
+})
+
+
 def _level_from_score(score: float) -> RiskLevel:
     if score >= 75:
         return RiskLevel.CRITICAL
@@ -19,35 +61,10 @@ def _clamp_score(v: float) -> float:
     return min(100.0, max(0.0, float(v)))
 
 
-def _transportation_risk(current: dict[str, Any]) -> RiskFactor:
-    wind_kph = float(current.get("wind_kph") or 0)
-    gust_kph = float(current.get("gust_kph") or wind_kph)
-    precip_mm = float(current.get("precip_mm") or 0)
-    vis_km = float(current.get("vis_km") or 10)
-    condition = current.get("condition") or {}
-    code = int(condition.get("code", 1000))
-
-    # WeatherAPI.com condition codes for snow, ice, sleet, freezing conditions
-    # Full set: patchy snow, light snow, moderate snow, heavy snow, ice pellets,
-    # blizzard, freezing rain, freezing drizzle, sleet, blowing snow
-    _SNOW_ICE_CODES = {
-        1063, 1066, 1069, 1072,                              # patchy rain/snow/sleet/freezing
-        1114, 1117,                                            # blowing snow, blizzard
-        1147,                                                  # freezing fog
-        1150, 1153, 1168, 1171,                               # drizzle, freezing drizzle
-        1198, 1201,                                            # light/heavy freezing rain
-        1204, 1207,                                            # light/heavy sleet
-        1210, 1213, 1216, 1219, 1222, 1225,                   # snow (light→heavy)
-        1237,                                                  # ice pellets
-        1249, 1252,                                            # light/moderate sleet showers
-        1255, 1258,                                            # light/moderate snow showers
-        1261, 1264,                                            # light/moderate ice pellet showers
-        1279, 1282,                                            # snow/ice with thunder
-    }
+def _transportation_risk(
+    wind_kph: float, gust_kph: float, precip_mm: float, vis_km: float, code: int,
+) -> RiskFactor:
     is_snow_ice = code in _SNOW_ICE_CODES
-
-    # Fog codes — not snow/ice but hazardous for transport
-    _FOG_CODES = {1030, 1135, 1147}
     is_fog = code in _FOG_CODES
 
     score = 0.0
@@ -107,17 +124,10 @@ def _transportation_risk(current: dict[str, Any]) -> RiskFactor:
     )
 
 
-def _power_outage_risk(current: dict[str, Any]) -> RiskFactor:
-    wind_kph = float(current.get("wind_kph") or 0)
-    gust_kph = float(current.get("gust_kph") or wind_kph)
-    precip_mm = float(current.get("precip_mm") or 0)
-    condition = current.get("condition") or {}
-    code = int(condition.get("code", 1000))
-    # Thunderstorm codes: thunder, patchy rain/snow/ice with thunder
-    _STORM_CODES = {1087, 1273, 1276, 1279, 1282}
+def _power_outage_risk(
+    wind_kph: float, gust_kph: float, precip_mm: float, code: int,
+) -> RiskFactor:
     is_storm = code in _STORM_CODES or 2000 <= code <= 2300
-    # Blizzard and heavy snow also threaten power lines
-    _HEAVY_WINTER_CODES = {1117, 1219, 1222, 1225, 1258}
     is_heavy_winter = code in _HEAVY_WINTER_CODES
 
     score = 0.0
@@ -166,13 +176,9 @@ def _power_outage_risk(current: dict[str, Any]) -> RiskFactor:
     )
 
 
-def _production_risk(current: dict[str, Any]) -> RiskFactor:
-    temp_c = float(current.get("temp_c") or 20)
-    feelslike_c = float(current.get("feelslike_c") or temp_c)
-    humidity = int(current.get("humidity") or 50)
-    uv = current.get("uv")
-    uv_val = float(uv) if uv is not None else 5.0
-
+def _production_risk(
+    temp_c: float, feelslike_c: float, humidity: int, uv_val: float,
+) -> RiskFactor:
     score = 0.0
     reasons: list[str] = []
     if feelslike_c >= 40:
@@ -222,14 +228,9 @@ def _production_risk(current: dict[str, Any]) -> RiskFactor:
     )
 
 
-def _port_and_route_risk(current: dict[str, Any]) -> RiskFactor:
-    wind_kph = float(current.get("wind_kph") or 0)
-    gust_kph = float(current.get("gust_kph") or wind_kph)
-    precip_mm = float(current.get("precip_mm") or 0)
-    vis_km = float(current.get("vis_km") or 10)
-    condition = current.get("condition") or {}
-    code = int(condition.get("code", 1000))
-
+def _port_and_route_risk(
+    wind_kph: float, gust_kph: float, precip_mm: float, vis_km: float, code: int,
+) -> RiskFactor:
     score = 0.0
     reasons: list[str] = []
     if gust_kph > 80:
@@ -247,16 +248,6 @@ def _port_and_route_risk(current: dict[str, Any]) -> RiskFactor:
     if vis_km < 2:
         score += 20
         reasons.append("Low visibility impacts maritime and aviation operations")
-    # Severe conditions that cause port/route closures: heavy rain, freezing rain,
-    # sleet, snow, blizzard, ice pellets, thunderstorms with precipitation
-    _SEVERE_CLOSURE_CODES = {
-        1117,                                # blizzard
-        1195, 1198, 1201,                    # heavy rain, light/heavy freezing rain
-        1204, 1207,                          # light/heavy sleet
-        1219, 1222, 1225,                    # moderate/heavy/blizzard snow
-        1237, 1264,                          # ice pellets
-        1273, 1276, 1279, 1282,              # thunderstorm variants
-    }
     if code in _SEVERE_CLOSURE_CODES:
         score += 40
         reasons.append("Severe weather conditions: high port/route closure probability")
@@ -289,9 +280,8 @@ def _port_and_route_risk(current: dict[str, Any]) -> RiskFactor:
     )
 
 
-def _raw_material_delay_risk(current: dict[str, Any]) -> RiskFactor:
-    trans = _transportation_risk(current)
-    port = _port_and_route_risk(current)
+def _raw_material_delay_risk(trans: RiskFactor, port: RiskFactor) -> RiskFactor:
+    # Derived from the transportation and port/route factors already scored.
     combined = _clamp_score((trans.score + port.score) / 2.0)
     level = _level_from_score(combined)
     return RiskFactor(
@@ -314,13 +304,57 @@ def compute_risk(current_weather: dict[str, Any]) -> dict[str, Any]:
             "primary_concerns": ["No weather data available."],
             "suggested_actions": ["Obtain current weather data for risk assessment."],
         }
+    condition = current.get("condition") or {}
+    return compute_risk_from_fields(
+        temp_c=current.get("temp_c"),
+        feelslike_c=current.get("feelslike_c"),
+        wind_kph=current.get("wind_kph"),
+        gust_kph=current.get("gust_kph"),
+        precip_mm=current.get("precip_mm"),
+        vis_km=current.get("vis_km"),
+        humidity=current.get("humidity"),
+        uv=current.get("uv"),
+        condition_code=condition.get("code", 1000),
+    )
+
+
+def compute_risk_from_fields(
+    *,
+    temp_c: float | None,
+    feelslike_c: float | None,
+    wind_kph: float | None,
+    gust_kph: float | None,
+    precip_mm: float | None,
+    vis_km: float | None,
+    humidity: int | None,
+    uv: float | None,
+    condition_code: int,
+) -> dict[str, Any]:
+    """
+    Score one weather observation given as plain fields — same result as
+    compute_risk() on the equivalent WeatherAPI ``current`` dict.  Missing or
+    zero values fall back to the same defaults.
+    """
+    wind = float(wind_kph or 0)
+    gust = float(gust_kph or wind)
+    precip = float(precip_mm or 0)
+    vis = float(vis_km or 10)
+    temp = float(temp_c or 20)
+    code = int(condition_code)
 
+    trans = _transportation_risk(wind, gust, precip, vis, code)
+    port = _port_and_route_risk(wind, gust, precip, vis, code)
     factors = [
-        _transportation_risk(current),
-        _power_outage_risk(current),
-        _production_risk(current),
-        _port_and_route_risk(current),
-        _raw_material_delay_risk(current),
+        trans,
+        _power_outage_risk(wind, gust, precip, code),
+        _production_risk(
+            temp,
+            float(feelslike_c or temp),
+            int(humidity or 50),
+            float(uv) if uv is not None else 5.0,
+        ),
+        port,
+        _raw_material_delay_risk(trans, port),
     ]
     scores = [f.score for f in factors]
     # Weight max score heavily — only severe individual factors should drive overall score.
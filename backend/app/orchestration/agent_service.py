@@ -953,6 +953,31 @@ def get_latest_risk_score(db: Session, oem_id: UUID) -> SupplyChainRiskScore | N
     )
 
 
+def get_status_with_risk_score(
+    db: Session, oem_id: UUID
+) -> tuple[AgentStatusEntity | None, float | None]:
+    """
+    Latest agent_status row plus the OEM's latest overallScore, read in one
+    round trip (the score as a scalar subquery) for the dashboard status poll.
+    """
+    latest_score = (
+        db.query(SupplyChainRiskScore.overallScore)
+        .filter(SupplyChainRiskScore.oemId == oem_id)
+        .order_by(SupplyChainRiskScore.createdAt.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    row = (
+        db.query(AgentStatusEntity, latest_score)
+        .order_by(AgentStatusEntity.createdAt.desc())
+        .first()
+    )
+    if row is None:
+        score = get_latest_risk_score(db, oem_id)
+        return None, score.overallScore if score else None
+    return row[0], row[1]
+
+
 def trigger_manual_analysis_sync(db: Session, oem_id: UUID | None) -> None:
     global _is_running
     # First, check for any in-progress run in the database so we don't
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -133,3 +133,38 @@ class ShipmentWeatherExposureResponse(BaseModel):
     overall_exposure_score: float
     risk_analysis_payload: dict[str, Any]
     agent_summary: str | None = None
+
+
+# ── Legacy v1 weather agent: structured LLM output ───────────────────
+
+
+class LegacyWeatherRisk(BaseModel):
+    title: str = Field(..., description="<city>: <specific condition>")
+    description: str = Field(..., description="Must quote the exact measured values")
+    severity: RiskLevel
+    affectedRegion: str | None = None
+    affectedSupplier: str | None = None
+    estimatedImpact: str | None = None
+    estimatedCost: float | None = None
+
+
+class LegacyWeatherOpportunity(BaseModel):
+    title: str = Field(..., description="<city>: <favorable condition>")
+    description: str = Field(..., description="Cite the actual favorable values")
+    type: Literal[
+        "cost_saving",
+        "time_saving",
+        "quality_improvement",
+        "market_expansion",
+        "supplier_diversification",
+    ]
+    affectedRegion: str | None = None
+    potentialBenefit: str | None = None
+    estimatedValue: float | None = None
+
+
+class LegacyWeatherResult(BaseModel):
+    """Risks and opportunities found in one shipment's weather rows."""
+
+    risks: list[LegacyWeatherRisk] = Field(default_factory=list)
+    opportunities: list[LegacyWeatherOpportunity] = Field(default_factory=list)
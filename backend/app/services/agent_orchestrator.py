@@ -5,6 +5,7 @@ import time
 import uuid
 from typing import Any
 
+import orjson
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
@@ -213,6 +214,10 @@ def _extract_json(text: str) -> dict | None:
     m = re.search(r"\{[\s\S]*\}", cleaned)
     if m:
         snippet = m.group(0)
+        try:
+            return orjson.loads(snippet)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity; let it decide
         try:
             return json.loads(snippet)
         except json.JSONDecodeError:
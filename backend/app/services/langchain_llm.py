@@ -4,14 +4,64 @@ Respects settings.llm_provider and falls back to Ollama when Anthropic
 is not configured, so analysis can run without ANTHROPIC_API_KEY.
 """
 
-from typing import Any
+import asyncio
+from typing import Any, Callable, TypeVar
 
 from app.config import settings
 
+T = TypeVar("T")
+
+# Built models are reused so their HTTP clients keep warm keep-alive
+# connections instead of re-handshaking on every call.  Async clients are
+# bound to the event loop they first ran on, and scheduler threads run their
+# own loops via asyncio.run, so models are cached per running loop; calls
+# made outside a loop share one sync-side entry.
+_loop_models: dict[asyncio.AbstractEventLoop, dict[tuple, Any]] = {}
+_sync_models: dict[tuple, Any] = {}
+
+
+def loop_scoped(store: dict[asyncio.AbstractEventLoop, T], factory: Callable[[], T]) -> T:
+    """
+    Return ``store``'s value for the running event loop, creating it with
+    ``factory`` on first use.  Entries of loops that have since closed
+    (finished ``asyncio.run`` calls) are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    value = store.get(loop)
+    if value is None:
+        for stale in [lp for lp in store if lp.is_closed()]:
+            del store[stale]
+        value = store[loop] = factory()
+    return value
+
+
+def _settings_key() -> tuple:
+    return (
+        (settings.llm_provider or "anthropic").lower(),
+        settings.openai_api_key, settings.openai_model, settings.openai_base_url,
+        settings.ollama_base_url, settings.ollama_model,
+        settings.anthropic_api_key, settings.anthropic_model,
+    )
+
 
 def get_chat_model() -> Any | None:
     """
-    Return a LangChain chat model for agent graph prompts.
+    Return a LangChain chat model for agent graph prompts, reusing the
+    instance built for the current event loop and LLM settings.
+    """
+    try:
+        cache = loop_scoped(_loop_models, dict)
+    except RuntimeError:
+        cache = _sync_models
+    key = _settings_key()
+    if key not in cache:
+        cache[key] = _build_chat_model()
+    return cache[key]
+
+
+def _build_chat_model() -> Any | None:
+    """
+    Build a LangChain chat model for agent graph prompts.
 
     - llm_provider=openai and openai_api_key set → ChatOpenAI (supports custom
       base_url for OpenAI-compatible proxies like sandlogic)
@@ -1,6 +1,7 @@
 from uuid import UUID
 from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import Text, cast, or_
 from sqlalchemy.orm import Session
 
 from app.models.supplier import Supplier
@@ -161,7 +162,11 @@ def delete_one(db: Session, id: UUID, oem_id: UUID) -> bool:
     return True
 
 
-def get_risks_by_supplier(db: Session, oem_id: Optional[UUID] = None) -> dict:
+def get_risks_by_supplier(
+    db: Session,
+    oem_id: Optional[UUID] = None,
+    supplier: Optional[Supplier] = None,
+) -> dict:
     """
     Lightweight aggregation used by the existing UI to show simple counts.
 
@@ -172,6 +177,10 @@ def get_risks_by_supplier(db: Session, oem_id: Optional[UUID] = None) -> dict:
     When oem_id is provided, only risks for that OEM are included so the
     summary matches the OEM's suppliers list (and war/news risks are not
     mixed across OEMs).
+
+    When supplier is provided, only risks that can count toward that
+    supplier are read (its name appears in the name fields, or its id in
+    supplierId); its entry is the same as in the unscoped map.
     """
     q = (
         db.query(
@@ -187,6 +196,19 @@ def get_risks_by_supplier(db: Session, oem_id: Optional[UUID] = None) -> dict:
     )
     if oem_id is not None:
         q = q.filter(Risk.oemId == oem_id)
+    if supplier is not None:
+        # Superset prefilter; the exact name matching below still decides.
+        # JSON text escapes quotes/backslashes, so such names skip the
+        # affectedSuppliers text match and read every risk instead.
+        name = supplier.name or ""
+        if '"' not in name and "\\" not in name:
+            q = q.filter(
+                or_(
+                    Risk.supplierId == supplier.id,
+                    Risk.affectedSupplier.contains(name, autoescape=True),
+                    cast(Risk.affectedSuppliers, Text).contains(name, autoescape=True),
+                )
+            )
     risks = q.all()
 
     # Build a supplierId -> supplier name lookup for risks missing affectedSupplier
@@ -421,19 +443,24 @@ def _build_swarm_summary_for_supplier(risks: List[Risk]) -> Optional[dict]:
 
 
 def get_latest_risk_analysis_by_supplier(
-    db: Session, oem_id: UUID
+    db: Session, oem_id: UUID, supplier_ids: Optional[List[UUID]] = None
 ) -> Dict[UUID, str]:
     """
     Return a mapping of supplier_id -> latest SupplierRiskAnalysis.description.
+
+    When supplier_ids is provided, only those suppliers are read.
     """
+    q = db.query(SupplierRiskAnalysis.supplierId, SupplierRiskAnalysis.description).filter(
+        SupplierRiskAnalysis.oemId == oem_id,
+        SupplierRiskAnalysis.supplierId.isnot(None),
+        SupplierRiskAnalysis.description.isnot(None),
+    )
+    if supplier_ids is not None:
+        q = q.filter(SupplierRiskAnalysis.supplierId.in_(supplier_ids))
+    # DISTINCT ON: Postgres returns only the newest row per supplier.
     rows = (
-        db.query(SupplierRiskAnalysis.supplierId, SupplierRiskAnalysis.description)
-        .filter(
-            SupplierRiskAnalysis.oemId == oem_id,
-            SupplierRiskAnalysis.supplierId.isnot(None),
-            SupplierRiskAnalysis.description.isnot(None),
-        )
-        .order_by(SupplierRiskAnalysis.createdAt.desc())
+        q.distinct(SupplierRiskAnalysis.supplierId)
+        .order_by(SupplierRiskAnalysis.supplierId, SupplierRiskAnalysis.createdAt.desc())
         .all()
     )
     result: Dict[UUID, str] = {}
@@ -444,18 +471,22 @@ def get_latest_risk_analysis_by_supplier(
 
 
 def get_latest_swarm_by_supplier(
-    db: Session, oem_id: UUID
+    db: Session, oem_id: UUID, supplier_ids: Optional[List[UUID]] = None
 ) -> Dict[UUID, dict]:
     """
     Return a mapping of supplier_id -> latest persisted swarm analysis dict.
 
     Queries the swarm_analysis table, returning the most recent
     SwarmAnalysis per supplier.  Keyed by supplier UUID (not name).
+    When supplier_ids is provided, only those suppliers are read.
     """
+    q = db.query(SwarmAnalysis).filter(SwarmAnalysis.oemId == oem_id)
+    if supplier_ids is not None:
+        q = q.filter(SwarmAnalysis.supplierId.in_(supplier_ids))
+    # DISTINCT ON: Postgres returns only the newest row per supplier.
     rows = (
-        db.query(SwarmAnalysis)
-        .filter(SwarmAnalysis.oemId == oem_id)
-        .order_by(SwarmAnalysis.createdAt.desc())
+        q.distinct(SwarmAnalysis.supplierId)
+        .order_by(SwarmAnalysis.supplierId, SwarmAnalysis.createdAt.desc())
         .all()
     )
 
@@ -0,0 +1,116 @@
+"""
+Short-lived in-memory cache for WeatherAPI lookups (used by weather_service).
+
+Results are keyed by endpoint and call arguments (city, date/days) and kept
+for 15 minutes (current conditions for one minute), so a timeline that
+re-requests a city and concurrent shipments sharing a waypoint reuse one
+response.  Concurrent misses for the same key share a single in-flight
+request instead of each hitting the API.  Fetchers return the raw response
+body, so cached values are immutable and each caller decodes its own copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.services.langchain_llm import loop_scoped
+
+CACHE_TTL_SECONDS = 900  # 15 minutes
+CURRENT_WEATHER_TTL_SECONDS = 60  # current conditions go stale quickly
+CACHE_MAX_ENTRIES = 1024
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# key -> (expiry_ts, value); ordered least- to most-recently used
+_cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+# event loop -> key -> in-flight fetch (tasks are bound to the loop that made them)
+_inflight: dict[asyncio.AbstractEventLoop, dict[tuple, asyncio.Task]] = {}
+# Shared fetches whose starting caller was cancelled: the fetch runs on that
+# caller's client, which may be closed before it finishes.
+_orphaned: weakref.WeakSet[asyncio.Task] = weakref.WeakSet()
+
+
+def _cache_get(key: tuple) -> Any | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expiry, value = entry
+    if expiry < time.monotonic():
+        _cache.pop(key, None)
+        return None
+    try:
+        _cache.move_to_end(key)
+    except KeyError:
+        pass
+    return value
+
+
+def _cache_put(key: tuple, value: Any, ttl_seconds: float) -> None:
+    _cache[key] = (time.monotonic() + ttl_seconds, value)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        try:
+            _cache.popitem(last=False)
+        except KeyError:
+            break
+
+
+def ttl_async_cache(ttl_seconds: float = CACHE_TTL_SECONDS) -> Callable[[F], F]:
+    """
+    Cache an async fetcher's non-None results for ``ttl_seconds``.
+
+    Cached values are shared between callers, so the fetcher must return
+    immutable data (raw response bytes).  The ``client`` argument is not
+    part of the key; a shared fetch runs on the client of the caller that
+    started it.  Failed lookups (None) are not cached so the next caller
+    retries.
+    """
+
+    def decorator(fn: F) -> F:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__,) + tuple(
+                value for name, value in bound.arguments.items() if name != "client"
+            )
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+
+            pending = loop_scoped(_inflight, dict)
+            task = pending.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                pending[key] = task
+
+                def _done(t: asyncio.Task) -> None:
+                    pending.pop(key, None)
+                    if not t.cancelled() and t.exception() is None and t.result() is not None:
+                        _cache_put(key, t.result(), ttl_seconds)
+
+                task.add_done_callback(_done)
+                # Shield so our cancellation doesn't abort the shared fetch.
+                try:
+                    return await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    _orphaned.add(task)
+                    raise
+            result = await asyncio.shield(task)
+            if result is None and task in _orphaned:
+                # Likely failed on the cancelled starter's closed client.
+                result = await fn(*args, **kwargs)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.weather_cache import CURRENT_WEATHER_TTL_SECONDS, ttl_async_cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,36 @@ def _location_query(city: str) -> str:
     return (city or "").strip() or ""
 
 
-async def get_current_weather(city: str) -> dict[str, Any] | None:
+def _response_json(r: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (forecasts run to tens of KB)."""
+    return orjson.loads(r.content)
+
+
+def _decode(body: bytes | None) -> Any:
+    """Decode a cached response body; every caller gets its own fresh object."""
+    return orjson.loads(body) if body is not None else None
+
+
+@asynccontextmanager
+async def _client_scope(client: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the caller's pooled *client* when given; otherwise a one-off client."""
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=15.0) as own:
+        yield own
+
+
+async def get_current_weather(
+    city: str, client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
+    return _decode(await _fetch_current_weather(city, client))
+
+
+@ttl_async_cache(ttl_seconds=CURRENT_WEATHER_TTL_SECONDS)
+async def _fetch_current_weather(
+    city: str, client: httpx.AsyncClient | None = None,
+) -> bytes | None:
     if not settings.weather_api_key:
         logger.warning("WEATHER_API_KEY not set")
         return None
@@ -33,11 +66,11 @@ async def get_current_weather(city: str) -> dict[str, Any] | None:
     }
     url = f"{BASE_URL}/current.json"
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async with _client_scope(client) as client:
         try:
             r = await client.get(url, params=params)
             r.raise_for_status()
-            return r.json()
+            return r.content
         except httpx.HTTPStatusError as e:
             if e.response.status_code in (400, 404):
                 resolved = await _resolve_location(client, q)
@@ -51,7 +84,7 @@ async def get_current_weather(city: str) -> dict[str, Any] | None:
                         },
                     )
                     r2.raise_for_status()
-                    return r2.json()
+                    return r2.content
             logger.error(
                 "Weather API error: %s %s", e.response.status_code, e.response.text
             )
@@ -68,7 +101,7 @@ async def _resolve_location(client: httpx.AsyncClient, q: str) -> str | None:
             params={"key": settings.weather_api_key, "q": q},
         )
         r.raise_for_status()
-        data = r.json()
+        data = _response_json(r)
         if not data or not isinstance(data, list):
             return None
         first = data[0] if data else None
@@ -83,8 +116,17 @@ async def _resolve_location(client: httpx.AsyncClient, q: str) -> str | None:
         return None
 
 
-async def get_historical_weather(city: str, date: str) -> dict[str, Any] | None:
+async def get_historical_weather(
+    city: str, date: str, client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
     """Fetch historical weather for a city on a specific date (YYYY-MM-DD)."""
+    return _decode(await _fetch_historical_weather(city, date, client))
+
+
+@ttl_async_cache()
+async def _fetch_historical_weather(
+    city: str, date: str, client: httpx.AsyncClient | None = None,
+) -> bytes | None:
     if not settings.weather_api_key:
         return None
     q = _location_query(city)
@@ -96,17 +138,26 @@ async def get_historical_weather(city: str, date: str) -> dict[str, Any] | None:
         "dt": date,
     }
     url = f"{BASE_URL}/history.json"
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async with _client_scope(client) as client:
         try:
             r = await client.get(url, params=params)
             r.raise_for_status()
-            return r.json()
+            return r.content
         except Exception as e:
             logger.exception("History API failed for %s on %s: %s", city, date, e)
             return None
 
 
-async def get_forecast(city: str, days: int | None = None) -> dict[str, Any] | None:
+async def get_forecast(
+    city: str, days: int | None = None, client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
+    return _decode(await _fetch_forecast(city, days, client))
+
+
+@ttl_async_cache()
+async def _fetch_forecast(
+    city: str, days: int | None = None, client: httpx.AsyncClient | None = None,
+) -> bytes | None:
     if not settings.weather_api_key:
         return None
     q = _location_query(city)
@@ -122,11 +173,11 @@ async def get_forecast(city: str, days: int | None = None) -> dict[str, Any] | N
         "alerts": "yes",
     }
     url = f"{BASE_URL}/forecast.json"
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async with _client_scope(client) as client:
         try:
             r = await client.get(url, params=params)
             r.raise_for_status()
-            return r.json()
+            return r.content
         except Exception as e:
             logger.exception("Forecast API failed: %s", e)
             return None
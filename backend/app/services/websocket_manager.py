@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Any, List
 
@@ -51,6 +52,31 @@ class ConnectionManager:
         for conn in dead_connections:
             await self.disconnect(conn)
 
+    async def broadcast_many(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Send several messages, in order, to every client.  Each message is
+        serialised once rather than once per connection.
+        """
+        if not self.active_connections or not messages:
+            return
+        # Same encoding as WebSocket.send_json()
+        texts = [
+            json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+            for message in messages
+        ]
+        dead_connections: list[WebSocket] = []
+        for connection in list(self.active_connections):
+            try:
+                for text in texts:
+                    await connection.send_text(text)
+            except WebSocketDisconnect:
+                dead_connections.append(connection)
+            except Exception:
+                # Do not break other listeners if one connection misbehaves
+                logger.exception("Error broadcasting websocket message")
+        for conn in dead_connections:
+            await self.disconnect(conn)
+
 
 manager = ConnectionManager()
 
@@ -0,0 +1 @@
+"""Makes the backend package (``app``) importable when pytest runs from the repo root."""
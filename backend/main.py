@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.config import settings
@@ -91,6 +92,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Predictive Supply Chain Agent API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
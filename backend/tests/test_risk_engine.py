@@ -0,0 +1,159 @@
+import pytest
+
+from app.core.risk_engine import compute_risk, compute_risk_from_fields
+
+FACTORS = ("transportation", "power_outage", "production", "port_and_route", "raw_material_delay")
+
+CLEAR = {
+    "temp_c": 21.0, "feelslike_c": 21.0, "wind_kph": 12.0, "gust_kph": 18.0,
+    "precip_mm": 0.0, "vis_km": 10.0, "humidity": 55, "uv": 4.0,
+    "condition": {"code": 1000, "text": "Sunny"},
+}
+
+
+def _fields(current: dict) -> dict:
+    """compute_risk_from_fields() kwargs for a WeatherAPI ``current`` dict."""
+    return {
+        "temp_c": current.get("temp_c"),
+        "feelslike_c": current.get("feelslike_c"),
+        "wind_kph": current.get("wind_kph"),
+        "gust_kph": current.get("gust_kph"),
+        "precip_mm": current.get("precip_mm"),
+        "vis_km": current.get("vis_km"),
+        "humidity": current.get("humidity"),
+        "uv": current.get("uv"),
+        "condition_code": (current.get("condition") or {}).get("code", 1000),
+    }
+
+
+def _assert_scores(result: dict, overall_score: float, overall_level: str, factors: tuple) -> None:
+    assert result["overall_score"] == pytest.approx(overall_score)
+    assert result["overall_level"].value == overall_level
+    got = {f.factor: (f.level.value, f.score) for f in result["factors"]}
+    assert got == {
+        name: (level, pytest.approx(score)) for name, (level, score) in zip(FACTORS, factors)
+    }
+
+
+# Expected values come from the scoring formulas as they were before
+# compute_risk() was split into per-field helpers.
+@pytest.mark.parametrize(
+    "current, overall_score, overall_level, factors",
+    [
+        pytest.param(
+            CLEAR,
+            0.0, "low",
+            (("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0)),
+            id="clear",
+        ),
+        # Missing readings fall back to the engine's defaults.
+        pytest.param(
+            {"temp_c": 18.0},
+            0.0, "low",
+            (("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0)),
+            id="missing-most-fields",
+        ),
+        pytest.param(
+            {**CLEAR, "condition": None, "wind_kph": 55.0},
+            31.9, "moderate",
+            (("moderate", 40.0), ("low", 10.0), ("low", 0.0), ("low", 10.0), ("moderate", 25.0)),
+            id="missing-condition",
+        ),
+        pytest.param(
+            {**CLEAR, "gust_kph": None, "wind_kph": 70.0},
+            34.9, "moderate",
+            (("moderate", 40.0), ("moderate", 30.0), ("low", 0.0), ("moderate", 25.0), ("moderate", 32.5)),
+            id="missing-gust",
+        ),
+        pytest.param(
+            {**CLEAR, "wind_kph": None, "gust_kph": 95.0},
+            44.0, "moderate",
+            (("moderate", 40.0), ("moderate", 30.0), ("low", 0.0), ("high", 50.0), ("moderate", 45.0)),
+            id="missing-wind",
+        ),
+        pytest.param(
+            {**CLEAR, "temp_c": None, "precip_mm": 6.0, "condition": {"code": 1201}},
+            36.7, "moderate",
+            (("moderate", 43.0), ("low", 0.0), ("low", 0.0), ("moderate", 40.0), ("moderate", 41.5)),
+            id="missing-temp-freezing-rain",
+        ),
+        pytest.param(
+            {**CLEAR, "feelslike_c": None, "uv": None, "humidity": None, "temp_c": 41.0},
+            28.8, "moderate",
+            (("low", 0.0), ("low", 0.0), ("moderate", 40.0), ("low", 0.0), ("low", 0.0)),
+            id="missing-extras",
+        ),
+        # Zeros are falsy and take the same defaults as missing values.
+        pytest.param(
+            {**CLEAR, "temp_c": 0.0, "wind_kph": 0.0, "gust_kph": 0.0, "precip_mm": 0.0, "vis_km": 0.0},
+            0.0, "low",
+            (("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 0.0)),
+            id="zeros",
+        ),
+        pytest.param(
+            {**CLEAR, "vis_km": 0.0, "condition": {"code": 1135}},
+            9.1, "low",
+            (("low", 12.0), ("low", 0.0), ("low", 0.0), ("low", 0.0), ("low", 6.0)),
+            id="zero-visibility-fog",
+        ),
+        pytest.param(
+            {**CLEAR, "wind_kph": 0.0, "gust_kph": 0.0, "precip_mm": 12.0, "condition": {"code": 1195}},
+            32.8, "moderate",
+            (("moderate", 25.0), ("low", 0.0), ("low", 0.0), ("moderate", 40.0), ("moderate", 32.5)),
+            id="zero-wind-heavy-rain",
+        ),
+        # Severe condition codes.
+        pytest.param(
+            {**CLEAR, "condition": {"code": 1087}},
+            32.4, "moderate",
+            (("low", 0.0), ("moderate", 45.0), ("low", 0.0), ("low", 0.0), ("low", 0.0)),
+            id="thunder",
+        ),
+        pytest.param(
+            {**CLEAR, "wind_kph": 85.0, "gust_kph": 120.0, "condition": {"code": 1117}},
+            80.0, "critical",
+            (("critical", 75.0), ("high", 60.0), ("low", 0.0), ("critical", 90.0), ("critical", 82.5)),
+            id="blizzard",
+        ),
+        pytest.param(
+            {**CLEAR, "temp_c": -12.0, "precip_mm": 6.0, "condition": {"code": 1201}},
+            36.7, "moderate",
+            (("moderate", 43.0), ("low", 0.0), ("low", 0.0), ("moderate", 40.0), ("moderate", 41.5)),
+            id="freezing-rain",
+        ),
+        pytest.param(
+            {**CLEAR, "vis_km": 0.2, "condition": {"code": 1135}},
+            33.8, "moderate",
+            (("moderate", 42.0), ("low", 0.0), ("low", 0.0), ("low", 20.0), ("moderate", 31.0)),
+            id="fog",
+        ),
+        pytest.param(
+            {**CLEAR, "precip_mm": 40.0, "condition": {"code": 1195}},
+            48.5, "moderate",
+            (("moderate", 25.0), ("low", 8.0), ("low", 0.0), ("high", 60.0), ("moderate", 42.5)),
+            id="heavy-rain",
+        ),
+        pytest.param(
+            {**CLEAR, "temp_c": -18.0, "feelslike_c": -25.0, "precip_mm": 3.0, "vis_km": 0.8, "condition": {"code": 1225}},
+            66.0, "high",
+            (("high", 73.0), ("moderate", 30.0), ("moderate", 35.0), ("high", 60.0), ("high", 66.5)),
+            id="heavy-snow-cold",
+        ),
+        pytest.param(
+            {**CLEAR, "condition": {"code": 2100}},
+            32.4, "moderate",
+            (("low", 0.0), ("moderate", 45.0), ("low", 0.0), ("low", 0.0), ("low", 0.0)),
+            id="storm-range-code",
+        ),
+        pytest.param(
+            {**CLEAR, "temp_c": 43.0, "feelslike_c": 47.0, "uv": 11.0, "humidity": 90},
+            41.8, "moderate",
+            (("low", 0.0), ("low", 0.0), ("high", 58.0), ("low", 0.0), ("low", 0.0)),
+            id="heat",
+        ),
+    ],
+)
+def test_risk_scores(current, overall_score, overall_level, factors):
+    _assert_scores(compute_risk(current), overall_score, overall_level, factors)
+    _assert_scores(compute_risk({"current": current}), overall_score, overall_level, factors)
+    _assert_scores(compute_risk_from_fields(**_fields(current)), overall_score, overall_level, factors)